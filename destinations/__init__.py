@@ -1,5 +1,7 @@
 """Destination factory and registry for transcript destinations."""
 
+import importlib
+from functools import lru_cache
 from typing import Any, Dict, Type
 
 from .base import TranscriptDestination
@@ -7,6 +9,14 @@ from .base import TranscriptDestination
 # Registry of available destinations
 DESTINATIONS: Dict[str, Type[TranscriptDestination]] = {}
 
+# Built-in destinations, imported on first use so that heavy dependencies
+# (e.g. the Google API client) are only loaded when that destination is chosen.
+# Maps destination type -> "module:ClassName" relative to this package.
+_BUILTIN_DESTINATIONS: Dict[str, str] = {
+    "google_docs": ".google_docs:GoogleDocsDestination",
+    "obsidian": ".obsidian:ObsidianDestination",
+}
+
 
 def register_destination(name: str, cls: Type[TranscriptDestination]) -> None:
     """Register a destination class.
@@ -16,6 +26,39 @@ def register_destination(name: str, cls: Type[TranscriptDestination]) -> None:
         cls: Destination class (must extend TranscriptDestination)
     """
     DESTINATIONS[name] = cls
+    _resolve_destination.cache_clear()
+
+
+def _load_builtin_destination(dest_type: str) -> Type[TranscriptDestination]:
+    """Import and register a built-in destination class.
+
+    Raises:
+        ImportError: If the destination's dependencies are not installed
+    """
+    module_name, class_name = _BUILTIN_DESTINATIONS[dest_type].split(":")
+    module = importlib.import_module(module_name, __name__)
+    cls = getattr(module, class_name)
+    register_destination(dest_type, cls)
+    return cls
+
+
+@lru_cache(maxsize=None)
+def _resolve_destination(dest_type: str) -> Type[TranscriptDestination]:
+    """Look up (importing if needed) the class registered for dest_type.
+
+    Raises:
+        ValueError: If dest_type is not registered
+        ImportError: If dependencies for a built-in destination are missing
+    """
+    if dest_type in DESTINATIONS:
+        return DESTINATIONS[dest_type]
+    if dest_type in _BUILTIN_DESTINATIONS:
+        return _load_builtin_destination(dest_type)
+
+    available = ", ".join(sorted(set(DESTINATIONS) | set(_BUILTIN_DESTINATIONS)))
+    raise ValueError(
+        f"Unknown destination type: {dest_type}. Available: {available}"
+    )
 
 
 def create_destination(
@@ -33,34 +76,10 @@ def create_destination(
 
     Raises:
         ValueError: If dest_type is not registered
+        ImportError: If dependencies for a built-in destination are missing
     """
-    if dest_type not in DESTINATIONS:
-        available = ", ".join(DESTINATIONS.keys())
-        raise ValueError(
-            f"Unknown destination type: {dest_type}. Available: {available}"
-        )
-
-    dest_class = DESTINATIONS[dest_type]
-    return dest_class(config, data_dir)
-
-
-# Import and register destinations
-def _register_all_destinations():
-    """Import and register all available destinations."""
-    try:
-        from .google_docs import GoogleDocsDestination
-        register_destination("google_docs", GoogleDocsDestination)
-    except ImportError:
-        pass  # Google Docs dependencies not available
-
-    try:
-        from .obsidian import ObsidianDestination
-        register_destination("obsidian", ObsidianDestination)
-    except ImportError:
-        pass  # Obsidian destination not yet implemented
-
+    return _resolve_destination(dest_type)(config, data_dir)
 
-_register_all_destinations()
 
 __all__ = [
     "TranscriptDestination",
@@ -1,7 +1,8 @@
 """Base class for transcript destinations."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, List
 
 
 class TranscriptDestination(ABC):
@@ -15,6 +16,11 @@ class TranscriptDestination(ABC):
     5. Validate configuration before use
     """
 
+    __slots__ = ("config", "data_dir", "_session_cache")
+
+    # Number of recent sessions kept by get_session_id()
+    SESSION_CACHE_SIZE = 8
+
     def __init__(self, config: Dict[str, Any], data_dir: str):
         """Initialize the destination with configuration.
 
@@ -24,6 +30,7 @@ class TranscriptDestination(ABC):
         """
         self.config = config
         self.data_dir = data_dir
+        self._session_cache: "OrderedDict[str, str]" = OrderedDict()
 
     @abstractmethod
     def validate_config(self) -> None:
@@ -88,6 +95,42 @@ class TranscriptDestination(ABC):
         """
         pass
 
+    def prefetch_metadata(self, filepaths: List[str]) -> None:
+        """Load audio metadata for the memos about to be processed.
+
+        Called once before the memo loop so destinations that use metadata
+        can extract it for all files in one batch instead of per memo.
+
+        Args:
+            filepaths: Paths of the audio files that will be processed
+        """
+        pass
+
+    def has_pending_writes(self) -> bool:
+        """Whether append_transcript has buffered content not yet written.
+
+        Destinations that batch writes override this together with flush().
+
+        Returns:
+            False by default (appends are written immediately)
+        """
+        return False
+
+    def flush(self) -> Dict[str, Exception]:
+        """Write out any transcripts buffered by append_transcript.
+
+        Buffered content is discarded whether or not it was written.
+
+        Returns:
+            dict mapping filepath -> exception for buffered memos that were
+            not written; empty if everything was written
+
+        Raises:
+            Exception: If writing fails outright; every buffered memo is
+                then treated as not written
+        """
+        return {}
+
     @abstractmethod
     def cleanup(self) -> None:
         """Clean up resources and print summary information.
@@ -96,6 +139,33 @@ class TranscriptDestination(ABC):
         """
         pass
 
+    def get_session_id(self, memo_datetime: Any, filepath: str = None) -> str:
+        """Get the session for a memo, reusing sessions of recent memos.
+
+        Memos with the same get_cache_key() share a session, so
+        prepare_for_memo() only runs once per document/file/tab. The most
+        recently used SESSION_CACHE_SIZE sessions are kept.
+
+        Args:
+            memo_datetime: Datetime object representing when the memo was recorded
+            filepath: Optional path to audio file for metadata extraction
+
+        Returns:
+            session_id from prepare_for_memo
+        """
+        cache_key = self.get_cache_key(memo_datetime, filepath)
+
+        session_id = self._session_cache.get(cache_key)
+        if session_id is not None:
+            self._session_cache.move_to_end(cache_key)
+            return session_id
+
+        session_id = self.prepare_for_memo(memo_datetime, filepath)
+        self._session_cache[cache_key] = session_id
+        if len(self._session_cache) > self.SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+        return session_id
+
     def get_cache_key(self, memo_datetime: Any, filepath: str = None) -> str:
         """Get cache key for session caching.
 
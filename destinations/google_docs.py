@@ -1,18 +1,62 @@
 """Google Docs destination for transcripts."""
 
 import json
+import os
 import re
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
-
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from .base import TranscriptDestination
+from .utils import (
+    close_metadata_cache,
+    extract_audio_metadata,
+    extract_audio_metadata_batch,
+    format_day,
+    init_metadata_cache,
+    monday_of,
+)
+
+# The Google API client libraries are slow to import, so they are loaded in
+# initialize()/_get_credentials() rather than at module import time.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """re.compile, memoized so tag strategies sharing a pattern share the regex."""
+    return re.compile(pattern)
+
+
+# Rule printed above and below each entry's heading, with its line breaks
+_SEPARATOR_LINE = f"\n{'─' * 50}\n"
+
+# Tokens this close to expiry are refreshed up front instead of mid-run
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _expires_soon(creds: "Credentials") -> bool:
+    """Whether creds expire within TOKEN_REFRESH_MARGIN (expiry is naive UTC)."""
+    expiry = creds.expiry
+    if not isinstance(expiry, datetime):
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return expiry - now < TOKEN_REFRESH_MARGIN
+
+
+def _insert_text_request(text: str, tab_id: Optional[str] = None) -> Dict:
+    """Build an insertText request appending to the end of a tab (or the body).
+
+    endOfSegmentLocation lets the API resolve the insertion point, so no
+    document fetch is needed to find the current end index.
+    """
+    location = {"tabId": tab_id} if tab_id else {}
+    return {"insertText": {"endOfSegmentLocation": location, "text": text}}
 
 
 # ============================================================================
@@ -23,6 +67,8 @@ from .base import TranscriptDestination
 class DocGroupingStrategy(ABC):
     """Base class for document grouping strategies."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         """Get the grouping key for document organization."""
@@ -35,24 +81,28 @@ class DocGroupingStrategy(ABC):
 
 
 class WeeklyDocGrouping(DocGroupingStrategy):
+    __slots__ = ()
+
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        weekday = memo_datetime.weekday()
-        monday = memo_datetime - timedelta(days=weekday)
-        return monday.strftime("%Y-%m-%d")
+        return monday_of(memo_datetime).isoformat()
 
     def get_doc_title(self, group_key: str) -> str:
         return f"{group_key} Voice Memo Transcripts"
 
 
 class MonthlyDocGrouping(DocGroupingStrategy):
+    __slots__ = ()
+
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        return memo_datetime.strftime("%Y-%m")
+        return f"{memo_datetime.year:04d}-{memo_datetime.month:02d}"
 
     def get_doc_title(self, group_key: str) -> str:
         return f"{group_key} Voice Memo Transcripts"
 
 
 class QuarterlyDocGrouping(DocGroupingStrategy):
+    __slots__ = ()
+
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         quarter = (memo_datetime.month - 1) // 3 + 1
         return f"{memo_datetime.year}-Q{quarter}"
@@ -62,6 +112,8 @@ class QuarterlyDocGrouping(DocGroupingStrategy):
 
 
 class YearlyDocGrouping(DocGroupingStrategy):
+    __slots__ = ()
+
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         return str(memo_datetime.year)
 
@@ -69,17 +121,22 @@ class YearlyDocGrouping(DocGroupingStrategy):
         return f"{group_key} Voice Memo Transcripts"
 
 
+@lru_cache(maxsize=1024)
+def _tag_key(pattern: "re.Pattern[str]", title: str) -> str:
+    """Grouping key for the first tag in a memo title, memoized per title."""
+    match = pattern.search(title)
+    return f"tag-{match.group(1)}" if match else "untagged"
+
+
 class TagBasedDocGrouping(DocGroupingStrategy):
+    __slots__ = ("tag_pattern",)
+
     def __init__(self, tag_pattern: str):
-        self.tag_pattern = re.compile(tag_pattern)
+        self.tag_pattern = _compile_pattern(tag_pattern)
 
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         # Extract tag from memo title metadata
-        title = metadata.get("title", "")
-        match = self.tag_pattern.search(title)
-        if match:
-            return f"tag-{match.group(1)}"
-        return "untagged"
+        return _tag_key(self.tag_pattern, metadata.get("title", ""))
 
     def get_doc_title(self, group_key: str) -> str:
         if group_key.startswith("tag-"):
@@ -89,6 +146,8 @@ class TagBasedDocGrouping(DocGroupingStrategy):
 
 
 class SingleDocGrouping(DocGroupingStrategy):
+    __slots__ = ()
+
     def get_group_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         return "single"
 
@@ -96,6 +155,16 @@ class SingleDocGrouping(DocGroupingStrategy):
         return "Voice Memo Transcripts"
 
 
+# Stateless strategies are shared by every destination instance
+DOC_GROUPING_STRATEGIES: Dict[str, DocGroupingStrategy] = {
+    "weekly": WeeklyDocGrouping(),
+    "monthly": MonthlyDocGrouping(),
+    "quarterly": QuarterlyDocGrouping(),
+    "yearly": YearlyDocGrouping(),
+    "single": SingleDocGrouping(),
+}
+
+
 # ============================================================================
 # Tab Grouping Strategies
 # ============================================================================
@@ -104,6 +173,8 @@ class SingleDocGrouping(DocGroupingStrategy):
 class TabGroupingStrategy(ABC):
     """Base class for tab grouping strategies."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         """Get the grouping key for tab organization."""
@@ -116,66 +187,115 @@ class TabGroupingStrategy(ABC):
 
 
 class DailyTabGrouping(TabGroupingStrategy):
+    __slots__ = ("date_format",)
+
     def __init__(self, date_format: str = "%B %d, %Y"):
         self.date_format = date_format
 
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        return memo_datetime.strftime("%Y-%m-%d")
+        return memo_datetime.date().isoformat()
 
     def get_tab_title(self, tab_key: str, memo_datetime: datetime) -> str:
-        return memo_datetime.strftime(self.date_format)
+        return format_day(self.date_format, memo_datetime.toordinal())
 
 
 class WeeklyTabGrouping(TabGroupingStrategy):
+    __slots__ = ()
+
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        weekday = memo_datetime.weekday()
-        monday = memo_datetime - timedelta(days=weekday)
-        return monday.strftime("%Y-%m-%d")
+        return monday_of(memo_datetime).isoformat()
 
     def get_tab_title(self, tab_key: str, memo_datetime: datetime) -> str:
-        weekday = memo_datetime.weekday()
-        monday = memo_datetime - timedelta(days=weekday)
-        return f"Week of {monday.strftime('%B %d, %Y')}"
+        # tab_key is already the Monday's ISO date
+        return _week_title(tab_key)
+
+
+_TAB_KEY_TABLE = str.maketrans(" ", "-")
+
+
+def _tab_key(name: str) -> str:
+    """Tab key for a configured range name, e.g. "Quick Notes" -> "quick-notes"."""
+    return name.lower().translate(_TAB_KEY_TABLE)
+
+
+@lru_cache(maxsize=256)
+def _week_title(monday_iso: str) -> str:
+    """Weekly tab title for a Monday given as YYYY-MM-DD."""
+    return f"Week of {date.fromisoformat(monday_iso).strftime('%B %d, %Y')}"
 
 
 class TimeOfDayTabGrouping(TabGroupingStrategy):
+    __slots__ = ("time_ranges", "_hour_to_key", "_key_to_title")
+
     def __init__(self, time_ranges: Dict[str, Tuple[int, int]]):
         self.time_ranges = time_ranges
+        keys = {name: _tab_key(name) for name in time_ranges}
+
+        # Resolve each hour of the day to its tab key once; the first
+        # configured range containing an hour wins. Bounds are compared
+        # rather than passed to range() so fractional hours like (5.5, 12)
+        # keep working
+        self._hour_to_key: List[str] = ["unknown"] * 24
+        for name, (start, end) in reversed(list(time_ranges.items())):
+            key = keys[name]
+            for hour in range(24):
+                if start > end:
+                    # Range wraps midnight, e.g. "Night": (22, 6)
+                    in_range = hour >= start or hour < end
+                else:
+                    in_range = start <= hour < end
+                if in_range:
+                    self._hour_to_key[hour] = key
+
+        self._key_to_title: Dict[str, str] = {}
+        for name, (start, end) in time_ranges.items():
+            self._key_to_title.setdefault(
+                keys[name], f"{name} ({start}:00-{end}:00)"
+            )
 
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        hour = memo_datetime.hour
-        for name, (start, end) in self.time_ranges.items():
-            if start <= hour < end:
-                return name.lower().replace(" ", "-")
-        return "unknown"
+        return self._hour_to_key[memo_datetime.hour]
 
     def get_tab_title(self, tab_key: str, memo_datetime: datetime) -> str:
-        # Find the original name from config
-        for name, (start, end) in self.time_ranges.items():
-            if name.lower().replace(" ", "-") == tab_key:
-                return f"{name} ({start}:00-{end}:00)"
-        return "Unknown Time"
+        return self._key_to_title.get(tab_key, "Unknown Time")
 
 
 class DurationTabGrouping(TabGroupingStrategy):
+    __slots__ = ("duration_ranges", "_starts", "_ranges", "_key_to_title")
+
     def __init__(self, duration_ranges: Dict[str, Tuple[int, float]]):
         self.duration_ranges = duration_ranges
 
+        # Ranges sorted by lower bound, for a bisect lookup; ranges are
+        # expected not to overlap
+        ordered = sorted(
+            duration_ranges.items(), key=lambda item: item[1][0]
+        )
+        self._starts: List[float] = [min_dur for _, (min_dur, _) in ordered]
+        self._ranges: List[Tuple[str, float]] = [
+            (_tab_key(name), max_dur) for name, (_, max_dur) in ordered
+        ]
+
+        self._key_to_title: Dict[str, str] = {}
+        for name in duration_ranges:
+            self._key_to_title.setdefault(_tab_key(name), name)
+
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         duration = metadata.get("duration", 0)
-        for name, (min_dur, max_dur) in self.duration_ranges.items():
-            if min_dur <= duration < max_dur:
-                return name.lower().replace(" ", "-")
+        i = bisect_right(self._starts, duration) - 1
+        if i >= 0:
+            key, max_dur = self._ranges[i]
+            if duration < max_dur:
+                return key
         return "unknown"
 
     def get_tab_title(self, tab_key: str, memo_datetime: datetime) -> str:
-        for name in self.duration_ranges.keys():
-            if name.lower().replace(" ", "-") == tab_key:
-                return name
-        return "Unknown Duration"
+        return self._key_to_title.get(tab_key, "Unknown Duration")
 
 
 class NoTabGrouping(TabGroupingStrategy):
+    __slots__ = ()
+
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
         return "all"  # All memos in one "tab" (really just the doc body)
 
@@ -184,15 +304,13 @@ class NoTabGrouping(TabGroupingStrategy):
 
 
 class TagBasedTabGrouping(TabGroupingStrategy):
+    __slots__ = ("tag_pattern",)
+
     def __init__(self, tag_pattern: str):
-        self.tag_pattern = re.compile(tag_pattern)
+        self.tag_pattern = _compile_pattern(tag_pattern)
 
     def get_tab_key(self, memo_datetime: datetime, metadata: Dict) -> str:
-        title = metadata.get("title", "")
-        match = self.tag_pattern.search(title)
-        if match:
-            return f"tag-{match.group(1)}"
-        return "untagged"
+        return _tag_key(self.tag_pattern, metadata.get("title", ""))
 
     def get_tab_title(self, tab_key: str, memo_datetime: datetime) -> str:
         if tab_key.startswith("tag-"):
@@ -201,6 +319,38 @@ class TagBasedTabGrouping(TabGroupingStrategy):
         return "Untagged"
 
 
+DEFAULT_TAB_TIME_RANGES = {
+    "Morning": (6, 12),
+    "Afternoon": (12, 18),
+    "Evening": (18, 24),
+    "Night": (0, 6),
+}
+
+DEFAULT_TAB_DURATION_RANGES = {
+    "Quick Notes": (0, 120),
+    "Standard": (120, 600),
+    "Extended": (600, float("inf")),
+}
+
+# tab_grouping -> factory building the strategy from the destination config
+TAB_GROUPING_FACTORIES: Dict[str, Callable[[Dict[str, Any]], TabGroupingStrategy]] = {
+    "daily": lambda config: DailyTabGrouping(
+        config.get("tab_date_format", "%B %d, %Y")
+    ),
+    "weekly": lambda config: WeeklyTabGrouping(),
+    "time-of-day": lambda config: TimeOfDayTabGrouping(
+        config.get("tab_time_ranges", DEFAULT_TAB_TIME_RANGES)
+    ),
+    "duration": lambda config: DurationTabGrouping(
+        config.get("tab_duration_ranges", DEFAULT_TAB_DURATION_RANGES)
+    ),
+    "none": lambda config: NoTabGrouping(),
+    "tag": lambda config: TagBasedTabGrouping(
+        config.get("tab_tag_pattern", config.get("doc_tag_pattern", r"#(\w+)"))
+    ),
+}
+
+
 class GoogleDocsDestination(TranscriptDestination):
     """Destination that writes transcripts to Google Docs.
 
@@ -208,7 +358,45 @@ class GoogleDocsDestination(TranscriptDestination):
     with one tab per day. Supports both weekly and single-document modes.
     """
 
+    __slots__ = (
+        "_token_path",
+        "_creds_path",
+        "_docs_map_path",
+        "_service",
+        "_docs",
+        "docs_created",
+        "_creds",
+        "_tabs_cache",
+        "_pending",
+        "_tab_headers",
+        "_docs_map",
+        "_docs_map_stat",
+        "_metadata_cache",
+        "doc_strategy",
+        "tab_strategy",
+        "_needs_metadata",
+    )
+
     SCOPES = ["https://www.googleapis.com/auth/documents"]
+    # Documents written concurrently by flush()
+    MAX_PARALLEL_WRITES = 4
+    # Characters of transcript text per batchUpdate; a document's queue is
+    # split into several calls beyond this, keeping each request body well
+    # under the API's size limit on heavy days
+    MAX_BATCH_CHARS = 1_000_000
+    # Partial response for _get_existing_tabs: tab titles and IDs only
+    _TABS_FIELDS = "tabs(tabProperties(tabId,title))"
+    # data_dir -> (credentials, service), shared by every destination
+    # instance in the process so later ones skip the token read and build()
+    _shared_auth: Dict[str, Tuple["Credentials", Any]] = {}
+    _shared_auth_lock = threading.Lock()
+    # Strategies that read audio metadata; with any other combination
+    # ffprobe is never run
+    _METADATA_CONSUMING_STRATEGIES = (
+        TagBasedTabGrouping,
+        DurationTabGrouping,
+        TagBasedDocGrouping,
+    )
 
     def __init__(self, config: Dict[str, Any], data_dir: str):
         """Initialize Google Docs destination.
@@ -224,38 +412,72 @@ class GoogleDocsDestination(TranscriptDestination):
             data_dir: Path to data directory for credentials/state
         """
         super().__init__(config, data_dir)
-        self.service = None
+        data_path = Path(data_dir)
+        self._token_path = data_path / "token.json"
+        self._creds_path = data_path / "credentials.json"
+        self._docs_map_path = data_path / "docs_by_week.json"  # Keep filename for backward compat
+        self.service = None  # also resets self._docs
         self.docs_created = []
+        self._creds = None
+        self._tabs_cache: Dict[str, Dict[str, str]] = {}  # doc_id -> {tab_title: tab_id}
+        # (doc_id, tab_id or None) -> (memo filepath, formatted entry) pairs
+        # awaiting flush(); a new tab's header has no filepath
+        self._pending: Dict[
+            Tuple[str, Optional[str]], List[Tuple[Optional[str], str]]
+        ] = {}
+        # (doc_id, tab_id) -> header of a tab created this run, queued ahead
+        # of the tab's first entry so a tab never gets a header on its own
+        self._tab_headers: Dict[Tuple[str, str], str] = {}
+        # Parsed docs_by_week.json and the (mtime_ns, size) it was read at
+        self._docs_map: Optional[Dict[str, Any]] = None
+        self._docs_map_stat: Optional[Tuple[int, int]] = None
+        # filepath -> audio metadata, shared by get_cache_key/prepare_for_memo
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
 
         # Initialize grouping strategies
         self.doc_strategy = self._create_doc_grouping_strategy()
         self.tab_strategy = self._create_tab_grouping_strategy()
+        self._needs_metadata = isinstance(
+            self.doc_strategy, self._METADATA_CONSUMING_STRATEGIES
+        ) or isinstance(self.tab_strategy, self._METADATA_CONSUMING_STRATEGIES)
+
+    @classmethod
+    def clear_shared_auth(cls) -> None:
+        """Forget the credentials and services shared between instances.
+
+        Later initialize() calls read the token and build the service again.
+        """
+        with cls._shared_auth_lock:
+            cls._shared_auth.clear()
+
+    @property
+    def service(self):
+        """Google Docs API service (None until initialize())."""
+        return self._service
+
+    @service.setter
+    def service(self, service) -> None:
+        self._service = service
+        # Resolve the documents() resource once rather than on every API call
+        self._docs = service.documents() if service is not None else None
 
     def _create_doc_grouping_strategy(self) -> DocGroupingStrategy:
         """Create document grouping strategy based on config."""
         # Handle backward compatibility
         if self.config.get("doc_id"):
-            return SingleDocGrouping()
+            return DOC_GROUPING_STRATEGIES["single"]
 
         if "use_weekly_docs" in self.config and self.config["use_weekly_docs"] is False:
-            return SingleDocGrouping()
+            return DOC_GROUPING_STRATEGIES["single"]
 
         # New configuration
         grouping = self.config.get("doc_grouping", "weekly").lower()
 
-        if grouping == "weekly":
-            return WeeklyDocGrouping()
-        elif grouping == "monthly":
-            return MonthlyDocGrouping()
-        elif grouping == "quarterly":
-            return QuarterlyDocGrouping()
-        elif grouping == "yearly":
-            return YearlyDocGrouping()
+        if grouping in DOC_GROUPING_STRATEGIES:
+            return DOC_GROUPING_STRATEGIES[grouping]
         elif grouping == "tag":
             pattern = self.config.get("doc_tag_pattern", r"#(\w+)")
             return TagBasedDocGrouping(pattern)
-        elif grouping == "single":
-            return SingleDocGrouping()
         else:
             raise ValueError(f"Unknown doc_grouping: {grouping}")
 
@@ -263,37 +485,33 @@ class GoogleDocsDestination(TranscriptDestination):
         """Create tab grouping strategy based on config."""
         grouping = self.config.get("tab_grouping", "daily").lower()
 
-        if grouping == "daily":
-            date_format = self.config.get("tab_date_format", "%B %d, %Y")
-            return DailyTabGrouping(date_format)
-        elif grouping == "weekly":
-            return WeeklyTabGrouping()
-        elif grouping == "time-of-day":
-            ranges = self.config.get("tab_time_ranges", {
-                "Morning": (6, 12),
-                "Afternoon": (12, 18),
-                "Evening": (18, 24),
-                "Night": (0, 6)
-            })
-            return TimeOfDayTabGrouping(ranges)
-        elif grouping == "duration":
-            ranges = self.config.get("tab_duration_ranges", {
-                "Quick Notes": (0, 120),
-                "Standard": (120, 600),
-                "Extended": (600, float('inf'))
-            })
-            return DurationTabGrouping(ranges)
-        elif grouping == "none":
-            return NoTabGrouping()
-        elif grouping == "tag":
-            pattern = self.config.get("tab_tag_pattern", self.config.get("doc_tag_pattern", r"#(\w+)"))
-            return TagBasedTabGrouping(pattern)
-        else:
+        factory = TAB_GROUPING_FACTORIES.get(grouping)
+        if factory is None:
             raise ValueError(f"Unknown tab_grouping: {grouping}")
+        return factory(self.config)
+
+    def _get_metadata(self, filepath: Optional[str]) -> Dict[str, Any]:
+        """Audio metadata for filepath, extracted once per file.
+
+        Returns an empty dict without a filepath or when no grouping strategy
+        reads metadata.
+        """
+        if not filepath or not self._needs_metadata:
+            return {}
+        metadata = self._metadata_cache.get(filepath)
+        if metadata is None:
+            metadata = extract_audio_metadata(filepath)
+            self._metadata_cache[filepath] = metadata
+        return metadata
+
+    def prefetch_metadata(self, filepaths: List[str]) -> None:
+        """Extract metadata for all upcoming memos in one batch, if it's used."""
+        if self._needs_metadata:
+            self._metadata_cache.update(extract_audio_metadata_batch(filepaths))
 
     def validate_config(self) -> None:
         """Validate that credentials.json exists."""
-        creds_path = Path(self.data_dir) / "credentials.json"
+        creds_path = self._creds_path
         if not creds_path.exists():
             raise FileNotFoundError(
                 f"Google credentials not found at {creds_path}\n"
@@ -302,8 +520,29 @@ class GoogleDocsDestination(TranscriptDestination):
 
     def initialize(self) -> None:
         """Initialize Google Docs service."""
-        creds = self._get_credentials()
-        self.service = build("docs", "v1", credentials=creds)
+        from googleapiclient.discovery import build
+
+        if self._needs_metadata:
+            init_metadata_cache(self.data_dir)
+
+        with self._shared_auth_lock:
+            shared = self._shared_auth.get(self.data_dir)
+            if shared is not None:
+                creds, service = shared
+                if creds.valid and not _expires_soon(creds):
+                    self._creds = creds
+                    self.service = service
+                    return
+
+            creds = self._get_credentials()
+            # The service keeps one authorized httplib2 connection for all
+            # calls, so it is built once and reused for every memo. Docs v1
+            # ships with a static discovery document, so skip probing the
+            # discovery file cache.
+            self.service = build(
+                "docs", "v1", credentials=creds, cache_discovery=False
+            )
+            self._shared_auth[self.data_dir] = (creds, self.service)
 
     def prepare_for_memo(self, memo_datetime: datetime, filepath: str = None) -> str:
         """Get or create document and tab for the memo.
@@ -315,11 +554,7 @@ class GoogleDocsDestination(TranscriptDestination):
         Returns:
             Session ID in format "doc_id:tab_id" or "doc_id" if no tabs
         """
-        # Extract metadata if filepath provided
-        metadata = {}
-        if filepath:
-            from .utils import extract_audio_metadata
-            metadata = extract_audio_metadata(filepath)
+        metadata = self._get_metadata(filepath)
 
         doc_id = self._get_or_create_doc(memo_datetime, metadata)
         tab_id = self._get_or_create_tab(doc_id, memo_datetime, metadata)
@@ -338,7 +573,10 @@ class GoogleDocsDestination(TranscriptDestination):
         memo_datetime: datetime,
         filepath: str,
     ) -> None:
-        """Append transcript to Google Doc tab (or document body if no tabs).
+        """Queue transcript for the Google Doc tab (or document body if no tabs).
+
+        Entries are buffered and written by flush(), so consecutive memos for
+        the same tab share a single batchUpdate call.
 
         Args:
             session_id: "doc_id:tab_id" from prepare_for_memo, or just "doc_id" if no tabs
@@ -348,21 +586,156 @@ class GoogleDocsDestination(TranscriptDestination):
             memo_datetime: When memo was recorded
             filepath: Path to audio file
         """
-        # Parse session_id
-        if ":" in session_id:
-            doc_id, tab_id = session_id.split(":", 1)
-        else:
-            doc_id = session_id
-            tab_id = None
+        # Parse session_id; no tab means no-tabs mode (append to document body)
+        doc_id, _, tab_id = session_id.partition(":")
 
-        if tab_id:
-            self._append_to_tab(doc_id, tab_id, memo_name, timestamp, transcript)
-        else:
-            # No tabs mode - append to document body
-            self._append_to_doc_body(doc_id, memo_name, timestamp, transcript)
+        content = self._format_entry(memo_name, timestamp, transcript)
+        self._queue_entry(doc_id, tab_id or None, content, filepath)
+
+    def _queue_entry(
+        self,
+        doc_id: str,
+        tab_id: Optional[str],
+        content: str,
+        filepath: Optional[str] = None,
+    ) -> None:
+        """Queue content for a tab, behind the tab's header if it is new."""
+        key = (doc_id, tab_id)
+        entries = self._pending.get(key)
+        if entries is None:
+            header = self._tab_headers.pop(key, None)
+            entries = self._pending[key] = [(None, header)] if header else []
+        entries.append((filepath, content))
+
+    def has_pending_writes(self) -> bool:
+        """Whether any queued transcripts have not been written yet."""
+        return bool(self._pending)
+
+    def flush(self) -> Dict[str, Exception]:
+        """Write all queued transcripts, one batchUpdate per document.
+
+        Documents are written concurrently. A document's queue may be split
+        into several batchUpdates; each is applied atomically, so when one
+        fails only the memos in it and the document's later batches are
+        reported. Queued entries are dropped either way.
+
+        Returns:
+            dict mapping filepath -> exception for memos that weren't written
+        """
+        # Inserts at the end of a segment are applied in order, so one batch
+        # can append several entries to the same tab
+        batches: Dict[str, List[List[Dict]]] = {}
+        batch_memos: Dict[str, List[List[str]]] = {}
+        batch_chars: Dict[str, int] = {}
+        for (doc_id, tab_id), entries in self._pending.items():
+            doc_batches = batches.setdefault(doc_id, [[]])
+            doc_memos = batch_memos.setdefault(doc_id, [[]])
+            for filepath, content in entries:
+                chars = batch_chars.get(doc_id, 0) + len(content)
+                if chars > self.MAX_BATCH_CHARS and doc_batches[-1]:
+                    doc_batches.append([])
+                    doc_memos.append([])
+                    chars = len(content)
+                batch_chars[doc_id] = chars
+                doc_batches[-1].append(_insert_text_request(content, tab_id))
+                if filepath is not None:
+                    doc_memos[-1].append(filepath)
+        self._pending = {}
+
+        failed: Dict[str, Exception] = {}
+        errors = self._execute_batch_updates(list(batches.items()))
+        for doc_id, (index, error) in errors.items():
+            # A tab may have been deleted outside this run - re-fetch next time
+            self._invalidate_tabs(doc_id)
+            for filepaths in batch_memos[doc_id][index:]:
+                for filepath in filepaths:
+                    failed[filepath] = error
+        return failed
+
+    def _execute_batch_updates(
+        self, batches: List[Tuple[str, List[List[Dict]]]]
+    ) -> Dict[str, Tuple[int, Exception]]:
+        """Send each document's batchUpdates, in parallel across documents.
+
+        A document's batches are sent in order, stopping at the first that
+        fails. httplib2 connections are not thread-safe, so each worker
+        thread executes its requests over its own authorized connection.
+        Without credentials (e.g. a service injected in tests) writes are
+        sequential.
+
+        Returns:
+            dict mapping doc_id -> (index of the batch that failed, exception)
+            for documents whose write failed; earlier batches were written
+        """
+        errors: Dict[str, Tuple[int, Exception]] = {}
+
+        if len(batches) == 1 or self._creds is None:
+            for doc_id, doc_batches in batches:
+                for index, requests in enumerate(doc_batches):
+                    try:
+                        self._docs.batchUpdate(
+                            documentId=doc_id, body={"requests": requests}
+                        ).execute()
+                    except Exception as e:
+                        errors[doc_id] = (index, e)
+                        break
+            return errors
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        import google_auth_httplib2
+        import httplib2
+
+        local = threading.local()
+
+        def execute(requests):
+            if not hasattr(local, "http"):
+                local.http = google_auth_httplib2.AuthorizedHttp(
+                    self._creds, http=httplib2.Http()
+                )
+            for index, request in enumerate(requests):
+                try:
+                    request.execute(http=local.http)
+                except Exception as e:
+                    return index, e
+            return None
+
+        workers = min(self.MAX_PARALLEL_WRITES, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                doc_id: pool.submit(
+                    execute,
+                    [
+                        self._docs.batchUpdate(
+                            documentId=doc_id, body={"requests": requests}
+                        )
+                        for requests in doc_batches
+                    ],
+                )
+                for doc_id, doc_batches in batches
+            }
+
+        for doc_id, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                # Failed before the first batch was sent
+                errors[doc_id] = (0, error)
+            elif future.result() is not None:
+                errors[doc_id] = future.result()
+        return errors
 
     def cleanup(self) -> None:
-        """Print summary of documents created."""
+        """Write any queued transcripts and print summary of documents created.
+
+        Raises:
+            Exception: The first error, if a queued transcript wasn't written
+        """
+        self._metadata_cache.clear()
+        close_metadata_cache()
+        failed = self.flush()
+        if failed:
+            raise next(iter(failed.values()))
+
         if self.docs_created:
             print("\n📄 Google Docs created:")
             for doc_id, title in self.docs_created:
@@ -381,11 +754,7 @@ class GoogleDocsDestination(TranscriptDestination):
         Returns:
             Cache key string
         """
-        # Extract metadata if filepath provided
-        metadata = {}
-        if filepath:
-            from .utils import extract_audio_metadata
-            metadata = extract_audio_metadata(filepath)
+        metadata = self._get_metadata(filepath)
 
         # Special case: user-specified doc ID
         if self.config.get("doc_id"):
@@ -401,11 +770,22 @@ class GoogleDocsDestination(TranscriptDestination):
 
         return f"{doc_key}:{tab_key}" if tab_key else doc_key
 
-    def _get_credentials(self) -> Credentials:
+    def _get_credentials(self) -> "Credentials":
         """Get or refresh Google API credentials."""
-        data_dir = Path(self.data_dir)
-        token_path = data_dir / "token.json"
-        creds_path = data_dir / "credentials.json"
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        # Reuse credentials from an earlier initialize() while still valid
+        if (
+            self._creds is not None
+            and self._creds.valid
+            and not _expires_soon(self._creds)
+        ):
+            return self._creds
+
+        token_path = self._token_path
+        creds_path = self._creds_path
 
         creds = None
 
@@ -413,6 +793,14 @@ class GoogleDocsDestination(TranscriptDestination):
         if token_path.exists():
             creds = Credentials.from_authorized_user_file(str(token_path), self.SCOPES)
 
+        save_token = False
+
+        # Refresh a token about to expire now, so it can't lapse between
+        # writes later in the run
+        if creds and creds.valid and creds.refresh_token and _expires_soon(creds):
+            creds.refresh(Request())
+            save_token = True
+
         # Refresh or get new credentials
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
@@ -427,19 +815,21 @@ class GoogleDocsDestination(TranscriptDestination):
                     str(creds_path), self.SCOPES
                 )
                 creds = flow.run_local_server(port=0)
+            save_token = True
 
-            # Save token for next run
-            with open(token_path, "w") as token_file:
-                token_file.write(creds.to_json())
+        if save_token:
+            # Save token for next run (skip the write if nothing changed)
+            token_json = creds.to_json()
+            if not token_path.exists() or token_path.read_text() != token_json:
+                with open(token_path, "w") as token_file:
+                    token_file.write(token_json)
 
+        self._creds = creds
         return creds
 
     def _get_monday_of_week(self, date: datetime) -> str:
         """Get the Monday of the week for a given date in YYYY-MM-DD format."""
-        weekday = date.weekday()
-        days_to_monday = weekday
-        monday = date - timedelta(days=days_to_monday)
-        return monday.strftime("%Y-%m-%d")
+        return monday_of(date).isoformat()
 
     def _get_or_create_doc(self, memo_date: datetime, metadata: Dict = None) -> str:
         """Get existing doc ID for the group or create a new document.
@@ -449,9 +839,6 @@ class GoogleDocsDestination(TranscriptDestination):
         if metadata is None:
             metadata = {}
 
-        data_dir = Path(self.data_dir)
-        docs_map_path = data_dir / "docs_by_week.json"  # Keep filename for backward compat
-
         # First check if user configured a specific doc ID
         if self.config.get("doc_id"):
             return self.config["doc_id"]
@@ -460,23 +847,7 @@ class GoogleDocsDestination(TranscriptDestination):
         group_key = self.doc_strategy.get_group_key(memo_date, metadata)
 
         # Load existing mappings
-        docs_map = {"groups": {}}
-        if docs_map_path.exists():
-            with open(docs_map_path) as f:
-                loaded_map = json.load(f)
-                # Handle legacy format
-                if "mode" in loaded_map:
-                    # Old structured format - migrate to new format
-                    if loaded_map["mode"] == "weekly":
-                        docs_map["groups"] = loaded_map.get("weekly", {})
-                    elif loaded_map["mode"] == "single":
-                        docs_map["groups"] = {"single": loaded_map.get("single")}
-                elif "groups" in loaded_map:
-                    # New format
-                    docs_map = loaded_map
-                else:
-                    # Legacy flat format - assume weekly
-                    docs_map["groups"] = loaded_map
+        docs_map = self._load_docs_map()
 
         # Check if we already have a doc for this group
         if group_key in docs_map["groups"]:
@@ -485,13 +856,12 @@ class GoogleDocsDestination(TranscriptDestination):
         # Create new document for this group
         doc_title = self.doc_strategy.get_doc_title(group_key)
         print(f"  Creating new Google Doc: '{doc_title}'")
-        doc = self.service.documents().create(body={"title": doc_title}).execute()
+        doc = self._docs.create(body={"title": doc_title}).execute()
         doc_id = doc["documentId"]
 
         # Save the mapping
         docs_map["groups"][group_key] = doc_id
-        with open(docs_map_path, "w") as f:
-            json.dump(docs_map, f, indent=2)
+        self._save_docs_map(docs_map)
 
         self.docs_created.append((doc_id, doc_title))
         print(f"  Created doc with ID: {doc_id}")
@@ -499,13 +869,90 @@ class GoogleDocsDestination(TranscriptDestination):
 
         return doc_id
 
+    def _load_docs_map(self) -> Dict[str, Any]:
+        """Load the group -> doc ID mapping, normalized to {"groups": {...}}.
+
+        The parsed mapping is cached and only re-read when the file's mtime
+        or size changes.
+        """
+        docs_map_path = self._docs_map_path
+
+        try:
+            st = os.stat(docs_map_path)
+        except FileNotFoundError:
+            self._docs_map = {"groups": {}}
+            self._docs_map_stat = None
+            return self._docs_map
+
+        file_stat = (st.st_mtime_ns, st.st_size)
+        if self._docs_map is not None and file_stat == self._docs_map_stat:
+            return self._docs_map
+
+        with open(docs_map_path) as f:
+            loaded_map = json.load(f)
+
+        if "groups" in loaded_map:
+            # New format
+            self._docs_map = loaded_map
+            self._docs_map_stat = file_stat
+            return loaded_map
+
+        # Legacy format - migrate once and persist so later runs take the fast path
+        docs_map = {"groups": {}}
+        if "mode" in loaded_map:
+            # Old structured format
+            if loaded_map["mode"] == "weekly":
+                docs_map["groups"] = loaded_map.get("weekly", {})
+            elif loaded_map["mode"] == "single":
+                docs_map["groups"] = {"single": loaded_map.get("single")}
+        else:
+            # Legacy flat format - assume weekly
+            docs_map["groups"] = loaded_map
+
+        self._save_docs_map(docs_map, pretty=True)
+        print(f"  Migrated {docs_map_path.name} to the current format")
+        return docs_map
+
+    def _save_docs_map(self, docs_map: Dict[str, Any], pretty: bool = False) -> None:
+        """Atomically write the group -> doc ID mapping and refresh the cache.
+
+        Args:
+            docs_map: Mapping in {"groups": {...}} format
+            pretty: Indent the JSON (used when migrating a legacy file, so the
+                one-off rewrite stays easy to inspect)
+        """
+        docs_map_path = self._docs_map_path
+        tmp_path = docs_map_path.with_suffix(".json.tmp")
+
+        with open(tmp_path, "w") as f:
+            if pretty:
+                json.dump(docs_map, f, indent=2)
+            else:
+                json.dump(docs_map, f, separators=(",", ":"))
+        os.replace(tmp_path, docs_map_path)
+
+        st = os.stat(docs_map_path)
+        self._docs_map = docs_map
+        self._docs_map_stat = (st.st_mtime_ns, st.st_size)
+
     def _get_existing_tabs(self, doc_id: str) -> dict[str, str]:
         """Get a mapping of tab titles to tab IDs for the document.
 
+        Results are cached per document for the lifetime of the destination,
+        so the API is only queried the first time a document is seen.
+
         Returns: dict mapping tab_title -> tab_id
         """
-        doc = self.service.documents().get(
-            documentId=doc_id, includeTabsContent=True
+        cached = self._tabs_cache.get(doc_id)
+        if cached is not None:
+            return cached
+
+        # tabs is only populated with includeTabsContent; the fields mask
+        # keeps the tab bodies out of the response
+        doc = self._docs.get(
+            documentId=doc_id,
+            includeTabsContent=True,
+            fields=self._TABS_FIELDS,
         ).execute()
 
         tabs = {}
@@ -518,8 +965,13 @@ class GoogleDocsDestination(TranscriptDestination):
                 if tab_id and tab_title:
                     tabs[tab_title] = tab_id
 
+        self._tabs_cache[doc_id] = tabs
         return tabs
 
+    def _invalidate_tabs(self, doc_id: str) -> None:
+        """Drop the cached tab mapping for a document so it is re-fetched."""
+        self._tabs_cache.pop(doc_id, None)
+
     def _get_or_create_tab(self, doc_id: str, memo_datetime: datetime, metadata: Dict = None) -> str:
         """Get existing tab or create a new one based on grouping strategy.
 
@@ -549,101 +1001,61 @@ class GoogleDocsDestination(TranscriptDestination):
 
         requests = [{"addDocumentTab": {"tabProperties": {"title": tab_title}}}]
 
-        response = self.service.documents().batchUpdate(
-            documentId=doc_id, body={"requests": requests}
-        ).execute()
+        try:
+            response = self._docs.batchUpdate(
+                documentId=doc_id, body={"requests": requests}
+            ).execute()
+        except Exception:
+            # Our view of the document may be stale - re-fetch next time
+            self._invalidate_tabs(doc_id)
+            raise
 
         # Extract the new tab ID from the response
         new_tab_id = response["replies"][0]["addDocumentTab"]["tabId"]
+        existing_tabs[tab_title] = new_tab_id
 
-        # Add a header to the new tab
-        header_text = f"📅 {tab_title}\n\nVoice Memo Transcripts\n\n"
-
-        self.service.documents().batchUpdate(
-            documentId=doc_id,
-            body={
-                "requests": [
-                    {
-                        "insertText": {
-                            "location": {"index": 1, "tabId": new_tab_id},
-                            "text": header_text,
-                        }
-                    }
-                ]
-            },
-        ).execute()
+        # The header is written with the tab's first transcript
+        self._tab_headers[(doc_id, new_tab_id)] = (
+            f"📅 {tab_title}\n\nVoice Memo Transcripts\n\n"
+        )
 
         return new_tab_id
 
-    def _get_tab_end_index(self, doc_id: str, tab_id: str) -> int:
-        """Get the end index of content in a specific tab."""
-        doc = self.service.documents().get(
-            documentId=doc_id, includeTabsContent=True
-        ).execute()
-
-        if "tabs" in doc:
-            for tab in doc["tabs"]:
-                if tab.get("tabProperties", {}).get("tabId") == tab_id:
-                    doc_tab = tab.get("documentTab", {})
-                    body = doc_tab.get("body", {})
-                    content = body.get("content", [])
-                    if content:
-                        return content[-1].get("endIndex", 1) - 1
-
-        return 1
+    def _format_entry(self, memo_name: str, timestamp: str, transcript: str) -> str:
+        """Format a transcript entry as plain text for insertion."""
+        return (
+            f"{_SEPARATOR_LINE}📝 {memo_name}\n🕐 {timestamp}"
+            f"{_SEPARATOR_LINE}\n{transcript}\n\n"
+        )
 
     def _append_to_tab(
         self, doc_id: str, tab_id: str, memo_name: str, timestamp: str, transcript: str
     ):
-        """Append a transcription to a specific tab in the Google Doc."""
-        content = f"\n{'─'*50}\n"
-        content += f"📝 {memo_name}\n"
-        content += f"🕐 {timestamp}\n"
-        content += f"{'─'*50}\n\n"
-        content += transcript
-        content += "\n\n"
-
-        # Get current tab content length
-        end_index = self._get_tab_end_index(doc_id, tab_id)
-
-        # Insert at end of tab
-        requests = [
-            {
-                "insertText": {
-                    "location": {"index": end_index, "tabId": tab_id},
-                    "text": content,
-                }
-            }
-        ]
+        """Append a transcription to a specific tab in the Google Doc right away.
 
-        self.service.documents().batchUpdate(
-            documentId=doc_id, body={"requests": requests}
-        ).execute()
+        Anything already queued for the tab (and a new tab's header) is
+        written first.
+        """
+        content = self._format_entry(memo_name, timestamp, transcript)
+        self._write_now(doc_id, tab_id, content)
 
     def _append_to_doc_body(
         self, doc_id: str, memo_name: str, timestamp: str, transcript: str
     ):
-        """Append a transcription to the document body (no tabs)."""
-        # Get current end index of document
-        doc = self.service.documents().get(documentId=doc_id).execute()
-        end_index = doc["body"]["content"][-1]["endIndex"] - 1
-
-        content = f"\n{'─'*50}\n"
-        content += f"📝 {memo_name}\n"
-        content += f"🕐 {timestamp}\n"
-        content += f"{'─'*50}\n\n"
-        content += transcript
-        content += "\n\n"
-
-        requests = [
-            {
-                "insertText": {
-                    "location": {"index": end_index},
-                    "text": content,
-                }
-            }
-        ]
-
-        self.service.documents().batchUpdate(
-            documentId=doc_id, body={"requests": requests}
-        ).execute()
+        """Append a transcription to the document body (no tabs) right away."""
+        content = self._format_entry(memo_name, timestamp, transcript)
+        self._write_now(doc_id, None, content)
+
+    def _write_now(self, doc_id: str, tab_id: Optional[str], content: str) -> None:
+        """Write queued entries for a tab followed by content in one batchUpdate."""
+        self._queue_entry(doc_id, tab_id, content)
+        entries = self._pending.pop((doc_id, tab_id))
+        requests = [_insert_text_request(text, tab_id) for _, text in entries]
+
+        try:
+            self._docs.batchUpdate(
+                documentId=doc_id, body={"requests": requests}
+            ).execute()
+        except Exception:
+            self._invalidate_tabs(doc_id)
+            raise
@@ -2,12 +2,48 @@
 
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from .base import TranscriptDestination
-from .utils import extract_audio_metadata, format_duration
+from .utils import (
+    close_metadata_cache,
+    extract_audio_metadata,
+    extract_audio_metadata_batch,
+    format_day,
+    format_duration,
+    init_metadata_cache,
+    monday_of,
+)
+
+
+# memo_count line in the frontmatter (value may be space-padded)
+_MEMO_COUNT_RE = re.compile(r"^memo_count:[ \t]*\d+[ \t]*$", re.MULTILINE)
+_MEMO_COUNT_HEADER_RE = re.compile(rb"^memo_count: ( *\d+ *)\n", re.MULTILINE)
+
+# Escapes backslashes and backticks that could break markdown, in one pass
+_TITLE_ESCAPE = str.maketrans({"\\": "\\\\", "`": "\\`"})
+
+
+class _FileState:
+    """Per-session state of one markdown file."""
+
+    __slots__ = ("count", "count_location", "has_count_field", "pending", "handle")
+
+    def __init__(self, count: int = 0, count_location: Optional[Tuple[int, int]] = None):
+        # Memos in the file, including those appended this session
+        self.count = count
+        # (byte offset, width) of the memo_count value, if known
+        self.count_location = count_location
+        # False once the frontmatter is known to have no memo_count field
+        # (e.g. the user removed it), so it's never searched for again
+        self.has_count_field = True
+        # True if the frontmatter memo_count is behind count
+        self.pending = False
+        # Append handle, kept open until cleanup() so a batch of memos for
+        # the same day costs one open()
+        self.handle: Optional[BinaryIO] = None
 
 
 class ObsidianDestination(TranscriptDestination):
@@ -17,6 +53,12 @@ class ObsidianDestination(TranscriptDestination):
     organized by date with proper Obsidian formatting.
     """
 
+    __slots__ = ("vault_path", "folder_path", "_files", "_prefetched_metadata")
+
+    # memo_count values are left-aligned and space-padded to this width so
+    # they can be updated in place without rewriting the file
+    MEMO_COUNT_WIDTH = 5
+
     def __init__(self, config: Dict[str, Any], data_dir: str):
         """Initialize Obsidian destination.
 
@@ -29,12 +71,15 @@ class ObsidianDestination(TranscriptDestination):
                 - include_frontmatter (optional): Add YAML frontmatter (default: True)
                 - include_tags (optional): Add #voice-memo tag (default: True)
                 - include_metadata (optional): Extract audio metadata (default: True)
-            data_dir: Path to data directory (not used by Obsidian)
+            data_dir: Path to data directory (holds the audio metadata cache)
         """
         super().__init__(config, data_dir)
         self.vault_path = None
         self.folder_path = None
-        self.memo_count = {}  # Track memos per file for frontmatter updates
+        # Markdown file -> its state this session (memo count, handle, ...)
+        self._files: Dict[str, _FileState] = {}
+        # Audio file -> metadata loaded by prefetch_metadata()
+        self._prefetched_metadata = {}
 
     def validate_config(self) -> None:
         """Validate that vault path exists and is a valid Obsidian vault."""
@@ -67,6 +112,14 @@ class ObsidianDestination(TranscriptDestination):
         # Create folder if it doesn't exist
         self.folder_path.mkdir(parents=True, exist_ok=True)
 
+        if self.config.get("include_metadata", True):
+            init_metadata_cache(self.data_dir)
+
+    def prefetch_metadata(self, filepaths: List[str]) -> None:
+        """Extract metadata for all upcoming memos in one batch, if it's used."""
+        if self.config.get("include_metadata", True):
+            self._prefetched_metadata.update(extract_audio_metadata_batch(filepaths))
+
     def prepare_for_memo(self, memo_datetime: datetime, filepath: str = None) -> str:
         """Prepare markdown file for the memo (daily or weekly).
 
@@ -82,25 +135,33 @@ class ObsidianDestination(TranscriptDestination):
 
         if organize_by == "weekly":
             # Get Monday of the week
-            monday = self._get_monday_of_week(memo_datetime)
-            filename = f"{monday.strftime(date_format)} Week.md"
+            monday = monday_of(memo_datetime)
+            filename = f"{format_day(date_format, monday.toordinal())} Week.md"
             file_path = self.folder_path / filename
 
-            if not file_path.exists():
-                self._create_file_with_header(
-                    file_path, monday, organize_by="weekly"
-                )
+            self._prepare_file(file_path, monday, organize_by="weekly")
         else:  # daily
-            filename = f"{memo_datetime.strftime(date_format)}.md"
+            filename = f"{format_day(date_format, memo_datetime.toordinal())}.md"
             file_path = self.folder_path / filename
 
-            if not file_path.exists():
-                self._create_file_with_header(
-                    file_path, memo_datetime, organize_by="daily"
-                )
+            self._prepare_file(file_path, memo_datetime.date(), organize_by="daily")
 
         return str(file_path)
 
+    def _prepare_file(self, file_path: Path, date: date, organize_by: str) -> None:
+        """Create the file if needed and load its memo_count, once per session."""
+        file_key = str(file_path)
+        if file_key in self._files:
+            return
+
+        if not file_path.exists():
+            self._files[file_key] = self._create_file_with_header(
+                file_path, date, organize_by=organize_by
+            )
+        else:
+            # Continuing a file from an earlier run
+            self._files[file_key] = self._load_file_state(file_path)
+
     def append_transcript(
         self,
         session_id: str,
@@ -120,27 +181,58 @@ class ObsidianDestination(TranscriptDestination):
             memo_datetime: When memo was recorded
             filepath: Path to audio file (for metadata extraction)
         """
-        file_path = Path(session_id)
-
         # Extract metadata if enabled
         metadata = {}
         if self.config.get("include_metadata", True):
-            metadata = extract_audio_metadata(filepath)
+            metadata = self._prefetched_metadata.pop(filepath, None)
+            if metadata is None:
+                metadata = extract_audio_metadata(filepath)
 
         # Format the content
         content = self._format_transcript_entry(
             memo_name, timestamp, transcript, metadata
         )
 
-        # Append to file
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(content)
+        # Append to file (flushed right away, so nothing is lost if the run
+        # dies before cleanup())
+        # session_id is the str(file path) this run's state is keyed by, so no
+        # Path is built unless the file is new to this session
+        state = self._files.get(session_id)
+        if state is None:
+            # session_id didn't come from prepare_for_memo() this run
+            state = self._files[session_id] = self._load_file_state(Path(session_id))
+        if state.handle is None:
+            state.handle = open(session_id, "ab")
+        state.handle.write(content.encode("utf-8"))
+        state.handle.flush()
+
+        # Count the memo; the frontmatter is updated by flush() or cleanup()
+        if self.config.get("include_frontmatter", True) and state.has_count_field:
+            state.count += 1
+            state.pending = True
+
+    def flush(self) -> Dict[str, Exception]:
+        """Write the memo_count of every file appended to since the last flush.
+
+        Entries are already on disk; the main loop calls this after each
+        memo, so counts stay exact even if the run stops before cleanup().
+        The fixed-width count is overwritten in place, without a re-read.
 
-        # Update memo count in frontmatter
-        self._update_memo_count(file_path)
+        Returns:
+            Always empty (a failed update raises)
+        """
+        self._flush_frontmatter_counts()
+        return {}
 
     def cleanup(self) -> None:
-        """Print summary of vault location."""
+        """Update frontmatter memo counts and print summary of vault location."""
+        for state in self._files.values():
+            if state.handle is not None:
+                state.handle.close()
+                state.handle = None
+        self._flush_frontmatter_counts()
+        close_metadata_cache()
+
         if self.folder_path:
             print(f"\n📝 Transcripts saved to Obsidian vault:")
             print(f"  {self.folder_path}")
@@ -161,67 +253,61 @@ class ObsidianDestination(TranscriptDestination):
         organize_by = self.config.get("organize_by", "daily")
 
         if organize_by == "weekly":
-            monday = self._get_monday_of_week(memo_datetime)
-            return monday.strftime("%Y-%m-%d")
+            return monday_of(memo_datetime).isoformat()
         else:
-            return memo_datetime.strftime("%Y-%m-%d")
-
-    def _get_monday_of_week(self, date: datetime) -> datetime:
-        """Get the Monday of the week for a given date."""
-        weekday = date.weekday()
-        days_to_monday = weekday
-        monday = date - timedelta(days=days_to_monday)
-        return monday
+            return memo_datetime.date().isoformat()
 
     def _create_file_with_header(
-        self, file_path: Path, date: datetime, organize_by: str = "daily"
-    ) -> None:
+        self, file_path: Path, date: date, organize_by: str = "daily"
+    ) -> _FileState:
         """Create a new markdown file with frontmatter and header.
 
         Args:
             file_path: Path to the file to create
             date: Date for the file
             organize_by: "daily" or "weekly"
+
+        Returns:
+            State of the new (empty) file
         """
+        state = _FileState()
         include_frontmatter = self.config.get("include_frontmatter", True)
         include_tags = self.config.get("include_tags", True)
 
-        content = ""
+        parts = []
 
         # Add frontmatter
         if include_frontmatter:
-            content += "---\n"
-            content += f"date: {date.strftime('%Y-%m-%d')}\n"
-            content += "type: voice-memo-transcript\n"
+            parts += ("---\n", f"date: {date.isoformat()}\n", "type: voice-memo-transcript\n")
 
             if include_tags:
-                content += "tags: [voice-memo]\n"
+                parts.append("tags: [voice-memo]\n")
 
             if organize_by == "weekly":
                 # Use the Monday date for week calculation (consistent with file naming)
-                monday = self._get_monday_of_week(date)
-                week_num = monday.isocalendar()[1]
-                year = monday.isocalendar()[0]  # Use ISO year (handles year boundaries)
-                content += f"week: {year}-W{week_num:02d}\n"
+                # ISO year handles year boundaries
+                year, week_num, _ = monday_of(date).isocalendar()
+                parts.append(f"week: {year}-W{week_num:02d}\n")
 
-            content += "memo_count: 0\n"
-            content += "---\n\n"
+            parts.append("memo_count: ")
+            offset = len("".join(parts).encode("utf-8"))
+            state.count_location = (offset, self.MEMO_COUNT_WIDTH)
+            parts += (f"{0:<{self.MEMO_COUNT_WIDTH}}\n", "---\n\n")
 
         # Add header
         if organize_by == "weekly":
-            monday = self._get_monday_of_week(date)
-            header = f"# Voice Memos - Week of {monday.strftime('%B %d, %Y')}\n\n"
+            monday = monday_of(date)
+            parts.append(f"# Voice Memos - Week of {format_day('%B %d, %Y', monday.toordinal())}\n\n")
         else:
-            header = f"# Voice Memos - {date.strftime('%B %d, %Y')}\n\n"
+            parts.append(f"# Voice Memos - {format_day('%B %d, %Y', date.toordinal())}\n\n")
 
-        content += header
+        content = "".join(parts)
 
         # Write to file
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
 
-        # Initialize memo count
-        self.memo_count[str(file_path)] = 0
+        return state
 
     def _format_transcript_entry(
         self, memo_name: str, timestamp: str, transcript: str, metadata: Dict[str, Any]
@@ -240,66 +326,115 @@ class ObsidianDestination(TranscriptDestination):
         # Get title and sanitize for markdown
         title = metadata.get("title", memo_name)
         # Escape backslashes and backticks that could break markdown
-        title = title.replace("\\", "\\\\").replace("`", "\\`")
+        title = title.translate(_TITLE_ESCAPE)
 
-        content = "---\n\n"
-        content += f"## {title}\n\n"
-        content += f"**Recorded:** {timestamp}\n"
+        parts = ["---\n\n", f"## {title}\n\n", f"**Recorded:** {timestamp}\n"]
 
         # Add metadata if available
         if "duration" in metadata:
             duration_str = format_duration(metadata["duration"])
-            content += f"**Duration:** {duration_str}\n"
+            parts.append(f"**Duration:** {duration_str}\n")
 
         if "device" in metadata:
-            content += f"**Device:** {metadata['device']}\n"
+            parts.append(f"**Device:** {metadata['device']}\n")
+
+        parts += ("\n", transcript, "\n\n")
+
+        return "".join(parts)
+
+    def _load_file_state(self, file_path: Path) -> _FileState:
+        """Build the state of an existing file from its frontmatter."""
+        if not self.config.get("include_frontmatter", True):
+            return _FileState()
+        return self._read_count_from_header(file_path)
 
-        content += "\n"
-        content += transcript
-        content += "\n\n"
+    def _read_count_from_header(self, file_path: Path) -> _FileState:
+        """Read the memo_count from the frontmatter of an existing file.
 
-        return content
+        Only the start of the file is read; the frontmatter is a few lines.
+        The value's offset and width (including any padding) are remembered
+        so _update_memo_count can overwrite it in place.
 
-    def _update_memo_count(self, file_path: Path) -> None:
-        """Update the memo_count field in the frontmatter.
+        Returns:
+            State with the stored count, or 0 if the file has none
+        """
+        header_size = 2048
+        with open(file_path, "rb") as f:
+            header = f.read(header_size)
+
+        state = _FileState()
+        if not header.startswith(b"---\n"):
+            state.has_count_field = False
+            return state
+
+        # Only look inside the frontmatter
+        frontmatter_end = header.find(b"\n---", 3)
+        if frontmatter_end == -1:
+            # Unclosed, or longer than the header read: leave it to
+            # _update_memo_count, which reads the whole file
+            state.has_count_field = len(header) == header_size
+            return state
+
+        if b"memo_count:" not in header[:frontmatter_end]:
+            state.has_count_field = False
+            return state
+
+        match = _MEMO_COUNT_HEADER_RE.search(header, 0, frontmatter_end + 1)
+        if not match:
+            # Present but hand-edited (e.g. "memo_count:3"); rewritten in full
+            return state
+
+        return _FileState(int(match.group(1)), (match.start(1), len(match.group(1))))
+
+    def _flush_frontmatter_counts(self) -> None:
+        """Write the final memo_count of every file appended to since the last flush."""
+        for file_key in sorted(self._files):
+            state = self._files[file_key]
+            if state.pending and state.has_count_field:
+                self._update_memo_count(Path(file_key), state)
+                state.pending = False
+
+    def _update_memo_count(self, file_path: Path, state: _FileState) -> None:
+        """Set the memo_count field in the frontmatter to state.count.
 
         Args:
             file_path: Path to the markdown file
+            state: The file's state (its count_location is updated)
         """
-        if not self.config.get("include_frontmatter", True):
+        new_count = state.count
+        digits = str(new_count)
+        location = state.count_location
+
+        if location is not None and len(digits) <= location[1]:
+            # Overwrite just the value, padding to the width already on disk
+            offset, width = location
+            with open(file_path, "r+b") as f:
+                f.seek(offset)
+                f.write(digits.ljust(width).encode("ascii"))
             return
 
-        file_key = str(file_path)
-
-        # Read file once
+        # The count outgrew its field (e.g. 9 -> 10 in an older unpadded
+        # file): rewrite the file, widening the field for next time
+        state.count_location = None
+        value = f"{new_count:<{self.MEMO_COUNT_WIDTH}}"
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        # Increment count
-        if file_key not in self.memo_count:
-            # Extract current count from frontmatter
-            if "memo_count: " in content:
-                try:
-                    start = content.index("memo_count: ") + len("memo_count: ")
-                    end = content.index("\n", start)
-                    current_count = int(content[start:end])
-                    self.memo_count[file_key] = current_count
-                except (ValueError, IndexError):
-                    self.memo_count[file_key] = 0
-            else:
-                self.memo_count[file_key] = 0
-
-        self.memo_count[file_key] += 1
-        new_count = self.memo_count[file_key]
-
-        # Update memo_count in frontmatter only (before first closing ---)
-        # This ensures we only replace in frontmatter, not in content
-
-        # Match memo_count in the frontmatter (between --- markers)
-        pattern = r"(---\n(?:.*\n)*?)(memo_count:\s*\d+)(\n(?:.*\n)*?---)"
-        replacement = rf"\g<1>memo_count: {new_count}\g<3>"
-
-        updated_content = re.sub(pattern, replacement, content, count=1)
+        # Update memo_count in frontmatter only (before the closing ---),
+        # so a "memo_count:" line in a transcript is never touched
+        frontmatter_end = content.find("\n---", 3) if content.startswith("---\n") else -1
+        if frontmatter_end == -1:
+            state.has_count_field = False
+            return
+
+        frontmatter, replaced = _MEMO_COUNT_RE.subn(
+            f"memo_count: {value}", content[:frontmatter_end], count=1
+        )
+        if not replaced:
+            # Nothing to update; don't rewrite the file unchanged
+            state.has_count_field = False
+            return
+        updated_content = frontmatter + content[frontmatter_end:]
 
         # Write updated content
         with open(file_path, "w", encoding="utf-8") as f:
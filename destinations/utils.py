@@ -1,12 +1,78 @@
 """Shared utilities for destinations."""
 
 import json
-import subprocess
-from typing import Dict, Any
+import os
+import struct
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# subprocess, concurrent.futures and orjson are imported where they're
+# used: most runs find every file in the metadata cache or parse it
+# directly, and never need them.
+
+# On-disk cache of ffprobe results, stored in the data directory
+METADATA_CACHE_FILENAME = "audio_metadata_cache.json"
+
+# "size:mtime_ns:path" -> metadata; None until init_metadata_cache()
+_metadata_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_metadata_cache_path: Optional[Path] = None
+_metadata_cache_dirty = False
+
+
+def init_metadata_cache(data_dir: str) -> None:
+    """Load cached audio metadata from data_dir.
+
+    Until this is called (and after close_metadata_cache()),
+    extract_audio_metadata runs ffprobe for every call.
+
+    Args:
+        data_dir: Path to data directory for credentials/state
+    """
+    global _metadata_cache, _metadata_cache_path, _metadata_cache_dirty
+
+    cache_path = Path(data_dir) / METADATA_CACHE_FILENAME
+    if _metadata_cache is not None and _metadata_cache_path == cache_path:
+        return
+
+    try:
+        with open(cache_path, "rb") as f:
+            cache = loads_json(f.read())
+    except (OSError, ValueError):
+        cache = {}
+
+    _metadata_cache = cache if isinstance(cache, dict) else {}
+    _metadata_cache_path = cache_path
+    _metadata_cache_dirty = False
+
+
+def close_metadata_cache() -> None:
+    """Write new cache entries to disk and stop caching."""
+    global _metadata_cache, _metadata_cache_path, _metadata_cache_dirty
+
+    if _metadata_cache is not None and _metadata_cache_dirty:
+        tmp_path = _metadata_cache_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(_metadata_cache, f, separators=(",", ":"))
+            os.replace(tmp_path, _metadata_cache_path)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
+    _metadata_cache = None
+    _metadata_cache_path = None
+    _metadata_cache_dirty = False
 
 
 def extract_audio_metadata(filepath: str) -> Dict[str, Any]:
-    """Extract metadata from audio file using ffprobe.
+    """Extract metadata from audio file.
+
+    M4A/MP4 files are parsed directly; anything else (or a file the parser
+    can't read) goes through ffprobe. Results are cached by file path, size and modification time once
+    init_metadata_cache() has been called, so unchanged files are only
+    probed once across runs.
 
     Args:
         filepath: Path to the audio file
@@ -19,26 +85,293 @@ def extract_audio_metadata(filepath: str) -> Dict[str, Any]:
         - device: Device information from encoder field
         Returns empty dict if extraction fails.
     """
+    cache_key, cached = _lookup_cached_metadata(filepath)
+    if cached is not None:
+        return cached
+
+    metadata = _probe(filepath)
+    return _store_metadata(cache_key, metadata)
+
+
+def extract_audio_metadata_batch(filepaths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Extract metadata for several audio files at once.
+
+    Files missing from the cache are probed concurrently (one ffprobe
+    process per file, up to one per CPU), so a cold run doesn't pay the
+    process startup cost of each file in turn.
+
+    Args:
+        filepaths: Paths to the audio files
+
+    Returns:
+        dict mapping each filepath to its metadata (see extract_audio_metadata)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    to_probe = []
+
+    for filepath in dict.fromkeys(filepaths):
+        cache_key, cached = _lookup_cached_metadata(filepath)
+        if cached is not None:
+            results[filepath] = cached
+        else:
+            to_probe.append((filepath, cache_key))
+
+    if to_probe:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(len(to_probe), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            probed = pool.map(_probe, [filepath for filepath, _ in to_probe])
+            for (filepath, cache_key), metadata in zip(to_probe, probed):
+                results[filepath] = _store_metadata(cache_key, metadata)
+
+    return results
+
+
+def _lookup_cached_metadata(
+    filepath: str,
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Look filepath up in the metadata cache.
+
+    Returns:
+        (cache key, or None if caching is off or the file can't be stat'ed;
+         a copy of the cached metadata, or None on a miss)
+    """
+    if _metadata_cache is None:
+        return None, None
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None, None
+
+    cache_key = f"{st.st_size}:{st.st_mtime_ns}:{filepath}"
+    cached = _metadata_cache.get(cache_key)
+    return cache_key, dict(cached) if cached is not None else None
+
+
+def _store_metadata(
+    cache_key: Optional[str], metadata: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Cache a probe result and return a copy for the caller.
+
+    Failures (metadata is None) aren't cached so the file is probed again
+    next time.
+    """
+    global _metadata_cache_dirty
+
+    if metadata is None:
+        return {}
+    if cache_key is not None and _metadata_cache is not None:
+        _metadata_cache[cache_key] = metadata
+        _metadata_cache_dirty = True
+    return dict(metadata)
+
+
+def _probe(filepath: str) -> Optional[Dict[str, Any]]:
+    """Read metadata, parsing MP4 atoms directly and falling back to ffprobe."""
+    metadata = _parse_m4a_metadata(filepath)
+    if metadata is None:
+        metadata = _run_ffprobe(filepath)
+    return metadata
+
+
+# MP4 times are seconds since 1904-01-01 UTC
+_MP4_EPOCH = datetime(1904, 1, 1)
+
+# iTunes-style metadata items -> metadata fields (ffprobe's "title"/"encoder")
+_ILST_ITEMS = {b"\xa9nam": "title", b"\xa9too": "encoder"}
+
+
+def _iter_atoms(f, start: int, end: int):
+    """Yield (type, payload_start, atom_end) for the atoms in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, atom_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            # 64-bit size follows the type
+            (size,) = struct.unpack(">Q", f.read(8))
+            header = 16
+        elif size == 0:
+            # Atom extends to the end of its parent
+            size = end - pos
+        if size < header or pos + size > end:
+            raise ValueError(f"Malformed {atom_type!r} atom at offset {pos}")
+        yield atom_type, pos + header, pos + size
+        pos += size
+
+
+def _find_atom(f, start: int, end: int, atom_type: bytes):
+    """(payload_start, atom_end) of the first child of the given type, or None."""
+    for child_type, payload, child_end in _iter_atoms(f, start, end):
+        if child_type == atom_type:
+            return payload, child_end
+    return None
+
+
+def _read_mvhd(f, payload: int) -> Tuple[int, int, int]:
+    """(creation time, timescale, duration) from the mvhd atom payload at payload."""
+    f.seek(payload)
+    version = f.read(4)[0]
+    if version == 1:
+        created, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+    else:
+        created, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+    return created, timescale, duration
+
+
+def mp4_duration(filepath: str) -> Optional[float]:
+    """Duration in seconds of a well-formed MP4/M4A file with media data.
+
+    Every top-level atom must parse, and the file needs both a moov atom
+    (with mvhd) and a non-empty mdat atom.
+
+    Returns:
+        The duration, or None if the file isn't such an MP4 container (or
+        can't be read)
+    """
+    try:
+        with open(filepath, "rb") as f:
+            file_end = os.fstat(f.fileno()).st_size
+            moov = None
+            has_media = False
+            for atom_type, payload, atom_end in _iter_atoms(f, 0, file_end):
+                if atom_type == b"moov":
+                    moov = (payload, atom_end)
+                elif atom_type == b"mdat":
+                    has_media = has_media or atom_end > payload
+            if moov is None or not has_media:
+                return None
+
+            mvhd = _find_atom(f, *moov, b"mvhd")
+            if mvhd is None:
+                return None
+            _, timescale, duration = _read_mvhd(f, mvhd[0])
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+    return duration / timescale if timescale else None
+
+
+def _parse_m4a_metadata(filepath: str) -> Optional[Dict[str, Any]]:
+    """Read metadata straight from an MP4/M4A file's moov atom.
+
+    Only the few atoms holding the fields we use are read (mvhd for
+    duration and creation time, udta/meta/ilst for title and encoder);
+    media data is skipped over.
+
+    Returns:
+        Metadata dict (see extract_audio_metadata), or None if the file
+        isn't an MP4 container this parser understands
+    """
     try:
-        # Run ffprobe to get metadata as JSON
+        with open(filepath, "rb") as f:
+            file_end = os.fstat(f.fileno()).st_size
+            moov = _find_atom(f, 0, file_end, b"moov")
+            if moov is None:
+                return None
+            moov_start, moov_end = moov
+
+            metadata: Dict[str, Any] = {}
+
+            mvhd = _find_atom(f, moov_start, moov_end, b"mvhd")
+            if mvhd is not None:
+                created, timescale, duration = _read_mvhd(f, mvhd[0])
+                if timescale:
+                    metadata["duration"] = duration / timescale
+                try:
+                    creation = created and _MP4_EPOCH + timedelta(seconds=created)
+                except OverflowError:
+                    # Corrupt 64-bit creation time past datetime's range
+                    creation = None
+                if creation:
+                    metadata["creation_time"] = creation.strftime(
+                        "%Y-%m-%dT%H:%M:%S.000000Z"
+                    )
+
+            tags = {}
+            udta = _find_atom(f, moov_start, moov_end, b"udta")
+            meta = udta and _find_atom(f, udta[0], udta[1], b"meta")
+            # meta is a full box: 4 bytes of version/flags precede its children
+            ilst = meta and _find_atom(f, meta[0] + 4, meta[1], b"ilst")
+            if ilst:
+                for item_type, item_start, item_end in _iter_atoms(f, *ilst):
+                    field = _ILST_ITEMS.get(item_type)
+                    if field is None:
+                        continue
+                    data = _find_atom(f, item_start, item_end, b"data")
+                    if data is None:
+                        continue
+                    # data payload: 4 bytes type, 4 bytes locale, then the value
+                    f.seek(data[0] + 8)
+                    tags[field] = f.read(data[1] - data[0] - 8).decode(
+                        "utf-8", errors="replace"
+                    )
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+    if "title" in tags:
+        metadata["title"] = tags["title"]
+    encoder = tags.get("encoder", "")
+    if "iPhone" in encoder or "iPad" in encoder:
+        metadata["device"] = encoder
+
+    return metadata
+
+
+@lru_cache(maxsize=None)
+def _json_loader() -> Callable[[bytes], Any]:
+    """Return orjson.loads if orjson is installed, else json.loads."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON from bytes, with orjson when it's installed.
+
+    orjson parses several times faster than the json module, which adds up
+    for ffprobe output and the larger state files (metadata cache,
+    processed.json).
+
+    Raises:
+        ValueError: If data isn't valid JSON (json.JSONDecodeError, which
+            orjson's error subclasses, or UnicodeDecodeError)
+    """
+    return _json_loader()(data)
+
+
+def _run_ffprobe(filepath: str) -> Optional[Dict[str, Any]]:
+    """Read metadata with ffprobe.
+
+    Returns:
+        Metadata dict (see extract_audio_metadata), or None if ffprobe failed
+    """
+    import subprocess
+
+    try:
+        # Run ffprobe to get container metadata as JSON (only the format
+        # section is used, so streams aren't probed)
         result = subprocess.run(
             [
                 "ffprobe",
                 "-v", "quiet",
                 "-print_format", "json",
                 "-show_format",
-                "-show_streams",
                 filepath
             ],
             capture_output=True,
-            text=True,
             timeout=10
         )
 
         if result.returncode != 0:
-            return {}
+            return None
 
-        data = json.loads(result.stdout)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = loads_json(result.stdout)
         metadata = {}
 
         # Extract format tags
@@ -70,9 +403,28 @@ def extract_audio_metadata(filepath: str) -> Dict[str, Any]:
 
         return metadata
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, json.JSONDecodeError,
+            UnicodeDecodeError, FileNotFoundError):
         # ffprobe not available, file not found, or JSON parsing failed
-        return {}
+        return None
+
+
+def monday_of(day: date) -> date:
+    """Monday of the week containing day (a date or datetime).
+
+    Uses ordinal arithmetic, so no timedelta is built and the time of day
+    is dropped.
+    """
+    return date.fromordinal(day.toordinal() - day.weekday())
+
+
+@lru_cache(maxsize=512)
+def format_day(fmt: str, ordinal: int) -> str:
+    """strftime for a calendar day (given as a proleptic ordinal), memoized.
+
+    Keying on the ordinal means every memo from the same day shares an entry.
+    """
+    return date.fromordinal(ordinal).strftime(fmt)
 
 
 def format_duration(seconds: float) -> str:
@@ -84,7 +436,12 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted string like "3m 24s" or "1h 5m 30s"
     """
-    total_seconds = int(seconds)
+    return _format_seconds(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(total_seconds: int) -> str:
+    """format_duration for whole seconds; memos cluster in a small range."""
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     secs = total_seconds % 60
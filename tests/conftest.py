@@ -9,6 +9,25 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 
+# A minimal M4A header (ftyp box): not playable, but a valid structure
+M4A_HEADER = b'\x00\x00\x00\x20ftyp' + b'M4A \x00\x00\x00\x00' + b'M4A mp42isom\x00\x00\x00\x00'
+
+@pytest.fixture(autouse=True)
+def fresh_openai_client(monkeypatch):
+    """Make each test build its own OpenAI client from its patched class."""
+    monkeypatch.setattr("transcribe_memos._openai_client", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_google_auth():
+    """Keep Google credentials and services from being shared across tests."""
+    from destinations.google_docs import GoogleDocsDestination
+
+    GoogleDocsDestination.clear_shared_auth()
+    yield
+    GoogleDocsDestination.clear_shared_auth()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
@@ -50,9 +69,7 @@ def sample_audio_file(temp_dir):
     audio_path = temp_dir / "test_memo.m4a"
 
     # Create a minimal valid M4A file (just header, not playable but valid structure)
-    # This is a simplified M4A header
-    m4a_header = b'\x00\x00\x00\x20ftyp' + b'M4A \x00\x00\x00\x00' + b'M4A mp42isom\x00\x00\x00\x00'
-    m4a_header += b'\x00\x00\x00\x08wide'
+    m4a_header = M4A_HEADER + b'\x00\x00\x00\x08wide'
     m4a_header += b'\x00\x00\x00\x00' * 100  # Padding to make it larger
 
     with open(audio_path, "wb") as f:
@@ -69,12 +86,10 @@ def large_audio_file(temp_dir):
     # Create a file larger than 25MB
     size_mb = 26
     with open(audio_path, "wb") as f:
-        # Write M4A header
-        m4a_header = b'\x00\x00\x00\x20ftyp' + b'M4A \x00\x00\x00\x00' + b'M4A mp42isom\x00\x00\x00\x00'
-        f.write(m4a_header)
-        # Fill with zeros to reach desired size
-        remaining = (size_mb * 1024 * 1024) - len(m4a_header)
-        f.write(b'\x00' * remaining)
+        f.write(M4A_HEADER)
+        # Extend with zeros to reach desired size (a sparse file, so the
+        # zeros aren't actually written)
+        f.truncate(size_mb * 1024 * 1024)
 
     return audio_path
 
@@ -185,9 +200,7 @@ def voice_memos_list(temp_dir):
     for i in range(3):
         memo_file = memos_dir / f"20250130_memo_{i}.m4a"
         with open(memo_file, "wb") as f:
-            # Write minimal M4A header
-            m4a_header = b'\x00\x00\x00\x20ftyp' + b'M4A \x00\x00\x00\x00' + b'M4A mp42isom\x00\x00\x00\x00'
-            f.write(m4a_header + b'\x00' * 1000)
+            f.write(M4A_HEADER + b'\x00' * 1000)
         memos.append(memo_file)
 
     return memos
@@ -54,8 +54,8 @@ class TestDestinationCreation:
 class TestGoogleDocsWorkflow:
     """Test complete workflow with Google Docs destination."""
 
-    @patch("destinations.google_docs.Credentials")
-    @patch("destinations.google_docs.build")
+    @patch("google.oauth2.credentials.Credentials")
+    @patch("googleapiclient.discovery.build")
     def test_full_workflow(self, mock_build, mock_creds_class, config_dir):
         """Test complete transcription workflow with Google Docs."""
         # Setup credentials
@@ -132,13 +132,13 @@ class TestGoogleDocsWorkflow:
             "/path/to/audio.m4a",
         )
 
+        # Cleanup (writes queued transcripts)
+        dest.cleanup()
+
         # Verify service was called
         mock_service.documents().create.assert_called()
         mock_service.documents().batchUpdate.assert_called()
 
-        # Cleanup
-        dest.cleanup()
-
 
 @pytest.mark.integration
 class TestObsidianWorkflow:
@@ -188,7 +188,6 @@ class TestObsidianWorkflow:
             content = f.read()
         assert "First Memo" in content
         assert "This is the first transcript." in content
-        assert "memo_count: 1" in content
 
         # Append second transcript
         dest.append_transcript(
@@ -205,11 +204,14 @@ class TestObsidianWorkflow:
             content = f.read()
         assert "First Memo" in content
         assert "Second Memo" in content
-        assert "memo_count: 2" in content
 
-        # Cleanup
+        # Cleanup (writes the frontmatter memo_count)
         dest.cleanup()
 
+        with open(file_path, "r") as f:
+            content = f.read()
+        assert "memo_count: 2" in content
+
 
 @pytest.mark.integration
 class TestDestinationSwitching:
@@ -65,3 +65,73 @@ def test_factory_with_registered_destination():
     assert isinstance(dest, ConcreteDestination)
     assert dest.config == {"key": "value"}
     assert dest.data_dir == "/tmp/data"
+
+
+def test_builtin_destinations_are_imported_lazily():
+    """Test that importing the package does not load the Google API client."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, destinations; "
+        "sys.exit('googleapiclient' in sys.modules or 'destinations.google_docs' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code])
+
+    assert result.returncode == 0
+
+
+def test_register_destination_replaces_cached_class():
+    """Test that re-registering a name takes effect for later lookups."""
+
+    class OtherDestination(ConcreteDestination):
+        pass
+
+    register_destination("swap_dest", ConcreteDestination)
+    assert type(create_destination("swap_dest", {}, "/tmp")) is ConcreteDestination
+
+    register_destination("swap_dest", OtherDestination)
+    assert type(create_destination("swap_dest", {}, "/tmp")) is OtherDestination
+
+
+class CountingDestination(ConcreteDestination):
+    """Records how often prepare_for_memo runs."""
+
+    def __init__(self, config, data_dir):
+        super().__init__(config, data_dir)
+        self.prepared = []
+
+    def prepare_for_memo(self, memo_datetime, filepath=None):
+        self.prepared.append(memo_datetime)
+        return f"session-{memo_datetime}"
+
+    def get_cache_key(self, memo_datetime, filepath=None):
+        return str(memo_datetime)
+
+
+def test_get_session_id_reuses_prepared_session():
+    """Test that memos sharing a cache key are only prepared once."""
+    dest = CountingDestination({}, "/tmp")
+
+    assert dest.get_session_id("2025-01-30") == "session-2025-01-30"
+    assert dest.get_session_id("2025-01-30") == "session-2025-01-30"
+
+    assert dest.prepared == ["2025-01-30"]
+
+
+def test_get_session_id_evicts_least_recently_used():
+    """Test that the session cache is bounded."""
+
+    class SmallCacheDestination(CountingDestination):
+        SESSION_CACHE_SIZE = 2
+
+    dest = SmallCacheDestination({}, "/tmp")
+
+    dest.get_session_id("a")
+    dest.get_session_id("b")
+    dest.get_session_id("a")  # "b" is now least recently used
+    dest.get_session_id("c")
+    dest.get_session_id("a")
+    dest.get_session_id("b")
+
+    assert dest.prepared == ["a", "b", "c", "b"]
@@ -3,9 +3,17 @@
 import json
 import pytest
 from unittest.mock import patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from destinations.google_docs import GoogleDocsDestination
+from destinations.google_docs import (
+    DOC_GROUPING_STRATEGIES,
+    GoogleDocsDestination,
+    DailyTabGrouping,
+    DurationTabGrouping,
+    TimeOfDayTabGrouping,
+    WeeklyDocGrouping,
+    WeeklyTabGrouping,
+)
 
 
 @pytest.fixture
@@ -73,6 +81,131 @@ def mock_service():
     return mock
 
 
+@pytest.mark.unit
+class TestGroupingStrategies:
+    """Test document and tab grouping strategies."""
+
+    def test_weekly_doc_grouping_uses_monday(self):
+        """Test that weekly doc keys are the Monday of the week."""
+        strategy = WeeklyDocGrouping()
+
+        assert strategy.get_group_key(datetime(2025, 1, 30, 14, 30), {}) == "2025-01-27"
+        assert strategy.get_group_key(datetime(2025, 1, 27), {}) == "2025-01-27"
+        # Week spanning a year boundary
+        assert strategy.get_group_key(datetime(2025, 1, 1), {}) == "2024-12-30"
+
+    def test_period_doc_grouping_keys(self):
+        """Test monthly, quarterly and yearly group keys."""
+        memo_date = datetime(2025, 2, 3, 9, 15)
+
+        assert DOC_GROUPING_STRATEGIES["monthly"].get_group_key(memo_date, {}) == "2025-02"
+        assert DOC_GROUPING_STRATEGIES["quarterly"].get_group_key(memo_date, {}) == "2025-Q1"
+        assert DOC_GROUPING_STRATEGIES["yearly"].get_group_key(memo_date, {}) == "2025"
+
+    def test_stateless_doc_strategies_are_shared(self, config_dir):
+        """Test that destinations share the module-level strategy instances."""
+        dest_a = GoogleDocsDestination({"doc_grouping": "monthly"}, str(config_dir))
+        dest_b = GoogleDocsDestination({"doc_grouping": "Monthly"}, str(config_dir))
+
+        assert dest_a.doc_strategy is dest_b.doc_strategy
+        assert dest_a.doc_strategy is DOC_GROUPING_STRATEGIES["monthly"]
+
+    def test_daily_tab_title_uses_date_format(self):
+        """Test daily tab titles for default and custom formats."""
+        memo_date = datetime(2025, 1, 30, 14, 30)
+
+        assert DailyTabGrouping().get_tab_title("2025-01-30", memo_date) == "January 30, 2025"
+        assert DailyTabGrouping("%Y/%m/%d").get_tab_title("2025-01-30", memo_date) == "2025/01/30"
+
+    def test_strategies_use_slots(self):
+        """Test that strategy instances don't carry a per-instance __dict__."""
+        assert not hasattr(DOC_GROUPING_STRATEGIES["weekly"], "__dict__")
+        assert not hasattr(WeeklyTabGrouping(), "__dict__")
+
+    def test_tag_strategies_share_compiled_pattern(self, config_dir):
+        """Test that doc and tab tag grouping reuse one compiled regex."""
+        dest = GoogleDocsDestination(
+            {"doc_grouping": "tag", "tab_grouping": "tag"}, str(config_dir)
+        )
+
+        assert dest.doc_strategy.tag_pattern is dest.tab_strategy.tag_pattern
+        assert dest.tab_strategy.get_tab_key(datetime(2025, 1, 30), {"title": "Call #work"}) == "tag-work"
+
+    def test_unknown_doc_grouping(self, config_dir):
+        """Test that an unknown doc_grouping is rejected."""
+        with pytest.raises(ValueError, match="Unknown doc_grouping"):
+            GoogleDocsDestination({"doc_grouping": "hourly"}, str(config_dir))
+
+    def test_tab_grouping_from_config(self, config_dir):
+        """Test that tab_grouping selects the strategy, case-insensitively."""
+        dest = GoogleDocsDestination({"tab_grouping": "Time-Of-Day"}, str(config_dir))
+
+        assert isinstance(dest.tab_strategy, TimeOfDayTabGrouping)
+        assert dest.tab_strategy.get_tab_key(datetime(2025, 1, 30, 3), {}) == "night"
+
+        with pytest.raises(ValueError, match="Unknown tab_grouping"):
+            GoogleDocsDestination({"tab_grouping": "hourly"}, str(config_dir))
+
+    def test_weekly_tab_grouping(self):
+        """Test weekly tab key and title."""
+        strategy = WeeklyTabGrouping()
+        memo_date = datetime(2025, 2, 2, 23, 59)  # Sunday
+
+        assert strategy.get_tab_key(memo_date, {}) == "2025-01-27"
+        assert strategy.get_tab_title("2025-01-27", memo_date) == "Week of January 27, 2025"
+
+    def test_time_of_day_tab_key(self):
+        """Test that each hour maps to the first range containing it."""
+        strategy = TimeOfDayTabGrouping({
+            "Early Morning": (5, 9),
+            "Morning": (6, 12),
+            "Afternoon": (12, 18),
+        })
+
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 6), {}) == "early-morning"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 10), {}) == "morning"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 17, 59), {}) == "afternoon"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 20), {}) == "unknown"
+
+    def test_time_of_day_range_wrapping_midnight(self):
+        """Test that a range like (22, 6) covers the hours on both sides of midnight."""
+        strategy = TimeOfDayTabGrouping({"Day": (6, 22), "Night": (22, 6)})
+
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 23), {}) == "night"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 2), {}) == "night"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 6), {}) == "day"
+        assert strategy.get_tab_title("night", datetime(2025, 1, 30, 2)) == "Night (22:00-6:00)"
+        assert strategy.get_tab_title("dusk", datetime(2025, 1, 30, 2)) == "Unknown Time"
+
+    def test_time_of_day_fractional_bounds(self):
+        """Test that half-hour bounds are compared like whole ones."""
+        strategy = TimeOfDayTabGrouping({"Morning": (5.5, 12), "Late": (21.5, 4.5)})
+
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 5, 45), {}) == "unknown"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 6), {}) == "morning"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 21, 45), {}) == "unknown"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 22), {}) == "late"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 4), {}) == "late"
+        assert strategy.get_tab_key(datetime(2025, 1, 30, 5), {}) == "unknown"
+
+    def test_duration_tab_grouping(self):
+        """Test duration buckets, including the boundaries between them."""
+        strategy = DurationTabGrouping({
+            "Extended": (600, float("inf")),
+            "Quick Notes": (0, 120),
+            "Standard": (120, 600),
+        })
+        memo_date = datetime(2025, 1, 30)
+
+        assert strategy.get_tab_key(memo_date, {"duration": 0}) == "quick-notes"
+        assert strategy.get_tab_key(memo_date, {"duration": 119.9}) == "quick-notes"
+        assert strategy.get_tab_key(memo_date, {"duration": 120}) == "standard"
+        assert strategy.get_tab_key(memo_date, {"duration": 3600}) == "extended"
+        assert strategy.get_tab_key(memo_date, {"duration": -1}) == "unknown"
+        assert strategy.get_tab_title("quick-notes", memo_date) == "Quick Notes"
+        assert strategy.get_tab_title("epic", memo_date) == "Unknown Duration"
+
+
 @pytest.mark.unit
 class TestGoogleDocsValidation:
     """Test configuration validation."""
@@ -95,8 +228,8 @@ class TestGoogleDocsValidation:
 class TestGoogleDocsInitialization:
     """Test initialization."""
 
-    @patch('destinations.google_docs.build')
-    @patch('destinations.google_docs.Credentials')
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
     def test_initialize(self, mock_creds_class, mock_build, google_dest, config_dir):
         """Test that initialize sets up the service."""
         # Create dummy credentials
@@ -125,7 +258,128 @@ class TestGoogleDocsInitialization:
         google_dest.initialize()
 
         assert google_dest.service is not None
-        mock_build.assert_called_once_with("docs", "v1", credentials=mock_creds)
+        mock_build.assert_called_once_with(
+            "docs", "v1", credentials=mock_creds, cache_discovery=False
+        )
+
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
+    def test_service_shared_between_instances(self, mock_creds_class, mock_build, config_dir):
+        """Test that destinations using the same data_dir build the service once."""
+        (config_dir / "token.json").write_text("{}")
+        mock_creds = MagicMock()
+        mock_creds.valid = True
+        mock_creds.expiry = None
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        first = GoogleDocsDestination({}, str(config_dir))
+        second = GoogleDocsDestination({}, str(config_dir))
+        first.initialize()
+        second.initialize()
+
+        assert second.service is first.service
+        mock_build.assert_called_once()
+        mock_creds_class.from_authorized_user_file.assert_called_once()
+
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
+    def test_shared_service_refreshed_when_expiring_or_cleared(self, mock_creds_class, mock_build, config_dir):
+        """Test that shared auth is rebuilt for expiring credentials or after a clear."""
+        (config_dir / "token.json").write_text("{}")
+        expiring = MagicMock()
+        expiring.valid = True
+        expiring.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=10)
+        expiring.refresh_token = None
+        fresh = MagicMock()
+        fresh.valid = True
+        fresh.expiry = None
+        mock_creds_class.from_authorized_user_file.side_effect = [expiring, fresh, fresh]
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = GoogleDocsDestination({}, str(config_dir))
+        first.initialize()
+        second = GoogleDocsDestination({}, str(config_dir))
+        second.initialize()
+
+        # Credentials about to expire are not handed to the next instance
+        assert second.service is not first.service
+        assert mock_build.call_count == 2
+
+        GoogleDocsDestination.clear_shared_auth()
+        third = GoogleDocsDestination({}, str(config_dir))
+        third.initialize()
+
+        assert third.service is not second.service
+        assert mock_build.call_count == 3
+
+    def test_documents_resource_resolved_once(self, google_dest, mock_service):
+        """Test that service.documents() is resolved when the service is set."""
+        google_dest.service = mock_service
+        mock_service.documents.reset_mock()
+
+        google_dest._get_existing_tabs("test-doc-id")
+        google_dest._append_to_tab("test-doc-id", "tab-1", "Memo", "2025-01-30", "Text")
+
+        mock_service.documents.assert_not_called()
+
+    def test_destination_has_no_dict(self, google_dest):
+        """Test that instance state is slotted (no per-instance __dict__)."""
+        assert not hasattr(google_dest, "__dict__")
+
+
+@pytest.mark.unit
+class TestCredentials:
+    """Test credential loading and caching."""
+
+    @patch('google.oauth2.credentials.Credentials')
+    def test_credentials_cached_between_calls(self, mock_creds_class, google_dest, config_dir):
+        """Test that a valid token is only loaded from disk once."""
+        (config_dir / "token.json").write_text("{}")
+        mock_creds = MagicMock()
+        mock_creds.valid = True
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        assert google_dest._get_credentials() is mock_creds
+        assert google_dest._get_credentials() is mock_creds
+
+        mock_creds_class.from_authorized_user_file.assert_called_once()
+
+    @patch('google.auth.transport.requests.Request')
+    @patch('google.oauth2.credentials.Credentials')
+    def test_token_near_expiry_refreshed_up_front(self, mock_creds_class, mock_request, google_dest, config_dir):
+        """Test that a still-valid token about to expire is refreshed immediately."""
+        (config_dir / "token.json").write_text("{}")
+        mock_creds = MagicMock()
+        mock_creds.valid = True
+        mock_creds.refresh_token = "refresh"
+        mock_creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=1)
+        mock_creds.to_json.return_value = '{"token": "new"}'
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        assert google_dest._get_credentials() is mock_creds
+
+        mock_creds.refresh.assert_called_once()
+        assert (config_dir / "token.json").read_text() == '{"token": "new"}'
+
+    @patch('google.auth.transport.requests.Request')
+    @patch('google.oauth2.credentials.Credentials')
+    def test_unchanged_token_not_rewritten(self, mock_creds_class, mock_request, google_dest, config_dir):
+        """Test that token.json is left alone when the refreshed token is identical."""
+        token_path = config_dir / "token.json"
+        token_path.write_text('{"token": "same"}')
+
+        mock_creds = MagicMock()
+        mock_creds.valid = False
+        mock_creds.expired = True
+        mock_creds.refresh_token = "refresh"
+        mock_creds.to_json.return_value = '{"token": "same"}'
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            google_dest._get_credentials()
+
+        mock_creds.refresh.assert_called_once()
+        assert not any(call.args[1:] == ("w",) for call in mock_open.call_args_list)
 
 
 @pytest.mark.unit
@@ -194,6 +448,57 @@ class TestDocumentCreation:
         assert data["groups"]["single"] == "test-doc-id-123"
 
 
+    def test_legacy_docs_map_migrated_on_load(self, google_dest, docs_by_week_file):
+        """Test that a legacy flat mapping is rewritten in the grouped format."""
+        docs_map = google_dest._load_docs_map()
+
+        assert docs_map["groups"]["2025-01-27"] == "doc-id-1"
+
+        with open(docs_by_week_file) as f:
+            data = json.load(f)
+        assert data == {
+            "groups": {"2025-01-27": "doc-id-1", "2025-02-03": "doc-id-2"}
+        }
+
+    def test_legacy_structured_docs_map_migrated(self, google_dest, config_dir):
+        """Test that the old {"mode": ...} mapping is migrated."""
+        docs_path = config_dir / "docs_by_week.json"
+        docs_path.write_text(json.dumps({"mode": "weekly", "weekly": {"2025-01-27": "doc-w"}}))
+
+        docs_map = google_dest._load_docs_map()
+
+        assert docs_map == {"groups": {"2025-01-27": "doc-w"}}
+        assert json.loads(docs_path.read_text()) == docs_map
+
+    def test_docs_map_saved_atomically(self, google_dest, config_dir, mock_service):
+        """Test that the mapping file is replaced without leaving a temp file."""
+        google_dest.service = mock_service
+
+        google_dest._get_or_create_doc(datetime(2025, 1, 30), {})
+
+        assert (config_dir / "docs_by_week.json").exists()
+        assert not (config_dir / "docs_by_week.json.tmp").exists()
+        # Written compactly
+        assert (config_dir / "docs_by_week.json").read_text() == (
+            '{"groups":{"2025-01-27":"test-doc-id-123"}}'
+        )
+
+    def test_docs_map_cached_until_file_changes(self, google_dest, config_dir):
+        """Test that the mapping is only re-parsed when the file changes."""
+        docs_path = config_dir / "docs_by_week.json"
+        docs_path.write_text(json.dumps({"groups": {"2025-01-27": "doc-a"}}))
+
+        with patch("destinations.google_docs.json.load", wraps=json.load) as mock_load:
+            assert google_dest._load_docs_map()["groups"] == {"2025-01-27": "doc-a"}
+            google_dest._load_docs_map()
+            assert mock_load.call_count == 1
+
+            # Another process updates the file
+            docs_path.write_text(json.dumps({"groups": {"2025-01-27": "doc-bb"}}))
+            assert google_dest._load_docs_map()["groups"] == {"2025-01-27": "doc-bb"}
+            assert mock_load.call_count == 2
+
+
 @pytest.mark.unit
 class TestTabOperations:
     """Test tab creation and operations."""
@@ -207,6 +512,24 @@ class TestTabOperations:
         assert "January 30, 2025" in tabs
         assert tabs["January 30, 2025"] == "tab-1"
 
+    def test_get_existing_tabs_cached_per_doc(self, google_dest, mock_service):
+        """Test that tab metadata is fetched only once per document."""
+        google_dest.service = mock_service
+        mock_service.documents().get.reset_mock()
+
+        google_dest._get_existing_tabs("test-doc-id")
+        google_dest._get_existing_tabs("test-doc-id")
+
+        assert mock_service.documents().get.call_count == 1
+        assert mock_service.documents().get.call_args[1]["fields"] == (
+            "tabs(tabProperties(tabId,title))"
+        )
+
+        google_dest._invalidate_tabs("test-doc-id")
+        google_dest._get_existing_tabs("test-doc-id")
+
+        assert mock_service.documents().get.call_count == 2
+
     def test_get_or_create_tab_existing(self, google_dest, mock_service):
         """Test using existing tab."""
         google_dest.service = mock_service
@@ -229,8 +552,18 @@ class TestTabOperations:
         tab_id = google_dest._get_or_create_tab("test-doc-id", memo_date, {})
 
         assert tab_id == "new-tab-id"
-        # Should have called batchUpdate twice (create tab + add header)
-        assert mock_service.documents().batchUpdate.call_count == 2
+        # Only the tab is created now; the header waits for the tab's first entry
+        assert mock_service.documents().batchUpdate.call_count == 1
+        assert google_dest._tab_headers == {
+            ("test-doc-id", "new-tab-id"): "📅 February 01, 2025\n\nVoice Memo Transcripts\n\n"
+        }
+        assert not google_dest.has_pending_writes()
+
+        # New tab is recorded in the cache without another fetch
+        assert google_dest._get_existing_tabs("test-doc-id") == {
+            "February 01, 2025": "new-tab-id"
+        }
+        assert mock_service.documents().get.call_count == 1
 
 
 @pytest.mark.unit
@@ -262,6 +595,53 @@ class TestTranscriptAppend:
         assert "2025-01-30 14:30:00" in text
         assert "This is the transcript." in text
 
+    def test_append_to_tab_uses_end_of_segment(self, google_dest, mock_service):
+        """Test that appends don't need to fetch the document's end index."""
+        google_dest.service = mock_service
+        mock_service.documents().get.reset_mock()
+
+        google_dest._append_to_tab(
+            "test-doc-id", "tab-1", "First", "2025-01-30 14:30:00", "One."
+        )
+
+        mock_service.documents().get.assert_not_called()
+        body = mock_service.documents().batchUpdate.call_args[1]["body"]
+        insert = body["requests"][0]["insertText"]
+        assert insert["endOfSegmentLocation"] == {"tabId": "tab-1"}
+
+    def test_append_to_tab_includes_queued_header(self, google_dest, mock_service):
+        """Test that a new tab's header is written together with its first entry."""
+        google_dest.service = mock_service
+        mock_get = MagicMock()
+        mock_get.execute.return_value = {"tabs": []}
+        mock_service.documents().get.return_value = mock_get
+
+        tab_id = google_dest._get_or_create_tab("test-doc-id", datetime(2025, 2, 1), {})
+        google_dest._append_to_tab(
+            "test-doc-id", tab_id, "Memo", "2025-02-01 09:00:00", "Text."
+        )
+
+        # addDocumentTab + one write for header and entry
+        assert mock_service.documents().batchUpdate.call_count == 2
+        requests = mock_service.documents().batchUpdate.call_args[1]["body"]["requests"]
+        assert len(requests) == 2
+        assert requests[0]["insertText"]["text"].startswith("📅 February 01, 2025")
+        assert "Text." in requests[1]["insertText"]["text"]
+        assert not google_dest.has_pending_writes()
+
+    def test_append_to_doc_body(self, google_dest, mock_service):
+        """Test appending to the document body when tabs are not used."""
+        google_dest.service = mock_service
+
+        google_dest._append_to_doc_body(
+            "test-doc-id", "Memo", "2025-01-30 14:30:00", "Body text."
+        )
+
+        body = mock_service.documents().batchUpdate.call_args[1]["body"]
+        insert = body["requests"][0]["insertText"]
+        assert insert["endOfSegmentLocation"] == {}
+        assert "Body text." in insert["text"]
+
 
 @pytest.mark.unit
 class TestDestinationInterface:
@@ -279,6 +659,25 @@ class TestDestinationInterface:
         assert doc_id
         assert tab_id
 
+    @patch("destinations.google_docs.extract_audio_metadata", return_value={"duration": 42.0})
+    def test_metadata_extracted_once_per_file(self, mock_extract, config_dir, mock_service):
+        """Test that cache key and prepare share one metadata extraction."""
+        dest = GoogleDocsDestination({"tab_grouping": "duration"}, str(config_dir))
+        dest.service = mock_service
+
+        dest.get_session_id(datetime(2025, 1, 30), "/path/to/audio.m4a")
+
+        mock_extract.assert_called_once_with("/path/to/audio.m4a")
+
+    @patch("destinations.google_docs.extract_audio_metadata")
+    def test_metadata_skipped_for_date_grouping(self, mock_extract, google_dest, mock_service):
+        """Test that ffprobe isn't run when no strategy reads metadata."""
+        google_dest.service = mock_service
+
+        google_dest.get_session_id(datetime(2025, 1, 30), "/path/to/audio.m4a")
+
+        mock_extract.assert_not_called()
+
     def test_append_transcript(self, google_dest, mock_service):
         """Test appending transcript via interface."""
         google_dest.service = mock_service
@@ -293,7 +692,214 @@ class TestDestinationInterface:
             "/path/to/audio.m4a"
         )
 
+        # Appends are buffered until flush
+        mock_service.documents().batchUpdate.assert_not_called()
+        assert google_dest.has_pending_writes()
+
+        google_dest.flush()
+
         mock_service.documents().batchUpdate.assert_called()
+        assert not google_dest.has_pending_writes()
+
+    def test_append_transcript_without_tab(self, google_dest, mock_service):
+        """Test that a bare doc_id session appends to the document body."""
+        google_dest.service = mock_service
+
+        google_dest.append_transcript(
+            "test-doc", "My Memo", "2025-01-30 14:30", "Body text",
+            datetime(2025, 1, 30), "/path/to/audio.m4a",
+        )
+
+        assert list(google_dest._pending) == [("test-doc", None)]
+        google_dest.flush()
+        body = mock_service.documents().batchUpdate.call_args[1]["body"]
+        assert body["requests"][0]["insertText"]["endOfSegmentLocation"] == {}
+
+    def test_new_tab_header_waits_for_first_entry(self, google_dest, mock_service):
+        """Test that flushing another tab doesn't write a new tab's header alone."""
+        google_dest.service = mock_service
+        mock_get = MagicMock()
+        mock_get.execute.return_value = {"tabs": []}
+        mock_service.documents().get.return_value = mock_get
+
+        google_dest.append_transcript(
+            "test-doc-id:tab-1", "Earlier", "2025-01-31 09:00:00", "Old.",
+            datetime(2025, 1, 31), "/path/to/audio.m4a",
+        )
+        tab_id = google_dest._get_or_create_tab("test-doc-id", datetime(2025, 2, 1), {})
+        mock_service.documents().batchUpdate.reset_mock()
+
+        google_dest.flush()
+        requests = mock_service.documents().batchUpdate.call_args[1]["body"]["requests"]
+        assert [r["insertText"]["text"] for r in requests] == [
+            google_dest._format_entry("Earlier", "2025-01-31 09:00:00", "Old.")
+        ]
+
+        google_dest.append_transcript(
+            f"test-doc-id:{tab_id}", "Memo", "2025-02-01 09:00:00", "Text.",
+            datetime(2025, 2, 1), "/path/to/audio.m4a",
+        )
+        google_dest.flush()
+        requests = mock_service.documents().batchUpdate.call_args[1]["body"]["requests"]
+        assert len(requests) == 2
+        assert requests[0]["insertText"]["text"].startswith("📅 February 01, 2025")
+        assert requests[1]["insertText"]["endOfSegmentLocation"] == {"tabId": "new-tab-id"}
+
+    def test_flush_batches_appends_per_doc(self, google_dest, mock_service):
+        """Test that queued memos for one doc are written in a single batchUpdate."""
+        google_dest.service = mock_service
+        memo_date = datetime(2025, 1, 30)
+
+        for i in range(3):
+            google_dest.append_transcript(
+                "test-doc:tab-1",
+                f"Memo {i}",
+                "2025-01-30 14:30",
+                f"Transcript {i}",
+                memo_date,
+                "/path/to/audio.m4a",
+            )
+
+        google_dest.flush()
+
+        mock_service.documents().batchUpdate.assert_called_once()
+        requests = mock_service.documents().batchUpdate.call_args[1]["body"]["requests"]
+        assert len(requests) == 3
+
+        # Entries are appended to the end of the tab in order
+        for i, request in enumerate(requests):
+            insert = request["insertText"]
+            assert insert["endOfSegmentLocation"] == {"tabId": "tab-1"}
+            assert f"Transcript {i}" in insert["text"]
+        mock_service.documents().get.assert_not_called()
+
+    def test_flush_splits_large_queues(self, google_dest, mock_service):
+        """Test that a document's queue is split into size-bounded batchUpdates, in order."""
+        google_dest.service = mock_service
+        memo_date = datetime(2025, 1, 30)
+
+        for i in range(3):
+            google_dest.append_transcript(
+                "test-doc:tab-1", f"Memo {i}", "2025-01-30 14:30",
+                f"Transcript {i} " + "x" * 200_000, memo_date, "/path/to/audio.m4a",
+            )
+
+        with patch.object(GoogleDocsDestination, "MAX_BATCH_CHARS", 250_000):
+            google_dest.flush()
+
+        calls = mock_service.documents().batchUpdate.call_args_list
+        assert len(calls) == 3
+        for i, call in enumerate(calls):
+            assert call[1]["documentId"] == "test-doc"
+            (request,) = call[1]["body"]["requests"]
+            assert f"Transcript {i} " in request["insertText"]["text"]
+
+    @patch("google_auth_httplib2.AuthorizedHttp")
+    def test_flush_writes_docs_in_parallel(self, mock_authorized_http, google_dest, mock_service):
+        """Test that each document gets its own write, and failures are isolated."""
+        google_dest.service = mock_service
+        google_dest._creds = MagicMock()
+
+        requests_by_doc = {}
+
+        def batch_update(documentId, body):
+            request = MagicMock()
+            requests_by_doc[documentId] = request
+            if documentId == "doc-b":
+                request.execute.side_effect = RuntimeError("quota exceeded")
+            return request
+
+        mock_service.documents().batchUpdate.side_effect = batch_update
+
+        for doc_id in ("doc-a", "doc-b"):
+            google_dest.append_transcript(
+                f"{doc_id}:tab", "Memo", "2025-01-30 14:30", "Text",
+                datetime(2025, 1, 30), f"/path/to/{doc_id}.m4a",
+            )
+
+        failed = google_dest.flush()
+
+        assert list(failed) == ["/path/to/doc-b.m4a"]
+        assert str(failed["/path/to/doc-b.m4a"]) == "quota exceeded"
+
+        # Both documents were written over per-thread connections
+        for request in requests_by_doc.values():
+            request.execute.assert_called_once()
+            assert request.execute.call_args[1]["http"] is not None
+        assert not google_dest.has_pending_writes()
+
+    def test_failed_flush_invalidates_tab_cache(self, google_dest, mock_service):
+        """Test that tabs of a document whose write failed are re-fetched."""
+        google_dest.service = mock_service
+        google_dest._get_existing_tabs("test-doc-id")
+        mock_service.documents().batchUpdate.return_value.execute.side_effect = (
+            RuntimeError("tab not found")
+        )
+
+        google_dest.append_transcript(
+            "test-doc-id:tab-1", "Memo", "2025-01-30 14:30", "Text",
+            datetime(2025, 1, 30), "/path/to/audio.m4a",
+        )
+        assert list(google_dest.flush()) == ["/path/to/audio.m4a"]
+        assert "test-doc-id" not in google_dest._tabs_cache
+
+    def test_failed_split_batch_reports_only_unwritten_memos(self, google_dest, mock_service):
+        """Test that memos in batches written before a failing one count as written."""
+        google_dest.service = mock_service
+        writes = []
+
+        def batch_update(documentId, body):
+            request = MagicMock()
+            if len(writes) == 1:
+                request.execute.side_effect = RuntimeError("quota exceeded")
+            writes.append(body["requests"])
+            return request
+
+        mock_service.documents().batchUpdate.side_effect = batch_update
+
+        for i in range(3):
+            google_dest.append_transcript(
+                "test-doc:tab-1", f"Memo {i}", "2025-01-30 14:30",
+                "x" * 200_000, datetime(2025, 1, 30), f"/path/to/memo{i}.m4a",
+            )
+
+        with patch.object(GoogleDocsDestination, "MAX_BATCH_CHARS", 250_000):
+            failed = google_dest.flush()
+
+        # The document's batches stop at the one that failed
+        assert len(writes) == 2
+        assert sorted(failed) == ["/path/to/memo1.m4a", "/path/to/memo2.m4a"]
+        assert not google_dest.has_pending_writes()
+
+    def test_cleanup_flushes_pending(self, google_dest, mock_service):
+        """Test that cleanup writes any queued transcripts."""
+        google_dest.service = mock_service
+
+        google_dest.append_transcript(
+            "test-doc:tab-1",
+            "My Memo",
+            "2025-01-30 14:30",
+            "Transcript text here",
+            datetime(2025, 1, 30),
+            "/path/to/audio.m4a",
+        )
+        google_dest.cleanup()
+
+        mock_service.documents().batchUpdate.assert_called_once()
+
+    def test_cleanup_raises_if_pending_write_fails(self, google_dest, mock_service):
+        """Test that cleanup doesn't drop a failed write silently."""
+        google_dest.service = mock_service
+        mock_service.documents().batchUpdate.return_value.execute.side_effect = (
+            RuntimeError("API unavailable")
+        )
+
+        google_dest.append_transcript(
+            "test-doc:tab-1", "My Memo", "2025-01-30 14:30", "Text",
+            datetime(2025, 1, 30), "/path/to/audio.m4a",
+        )
+        with pytest.raises(RuntimeError, match="API unavailable"):
+            google_dest.cleanup()
 
     def test_cleanup_no_docs(self, google_dest, capsys):
         """Test cleanup with no docs created."""
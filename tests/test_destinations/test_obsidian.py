@@ -105,6 +105,10 @@ class TestObsidianInitialization:
 
         assert folder_path.exists()
 
+    def test_destination_has_no_dict(self, obsidian_dest):
+        """Test that instance state is slotted (no per-instance __dict__)."""
+        assert not hasattr(obsidian_dest, "__dict__")
+
 
 @pytest.mark.unit
 class TestFileCreation:
@@ -271,6 +275,28 @@ class TestTranscriptAppend:
         assert "**Duration:** 3m 24s" in content
         assert "**Device:** iPhone Version 18.1.1" in content
 
+    @patch("destinations.obsidian.extract_audio_metadata")
+    @patch("destinations.obsidian.extract_audio_metadata_batch")
+    def test_append_transcript_uses_prefetched_metadata(
+        self, mock_batch, mock_extract, obsidian_dest, obsidian_vault
+    ):
+        """Test that metadata loaded by prefetch_metadata isn't extracted again."""
+        mock_batch.return_value = {"/path/to/test.m4a": {"title": "Prefetched"}}
+
+        obsidian_dest.initialize()
+        obsidian_dest.prefetch_metadata(["/path/to/test.m4a"])
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "Test.m4a", "2025-01-30 14:30:00", "Transcript here.",
+            memo_date, "/path/to/test.m4a",
+        )
+
+        mock_batch.assert_called_once_with(["/path/to/test.m4a"])
+        mock_extract.assert_not_called()
+        with open(file_path, "r") as f:
+            assert "## Prefetched" in f.read()
+
     def test_append_multiple_transcripts(self, obsidian_dest, obsidian_vault):
         """Test appending multiple transcripts to same file."""
         obsidian_dest.initialize()
@@ -310,41 +336,227 @@ class TestMemoCount:
     """Test memo counting."""
 
     def test_memo_count_updates(self, obsidian_dest, obsidian_vault):
-        """Test that memo_count is updated in frontmatter."""
+        """Test that memo_count is written to the frontmatter once, on cleanup."""
         obsidian_dest.initialize()
         memo_date = datetime(2025, 1, 30, 14, 30, 0)
 
         file_path = obsidian_dest.prepare_for_memo(memo_date)
 
-        # Append first memo
-        obsidian_dest.append_transcript(
-            file_path,
-            "First.m4a",
-            "2025-01-30 14:30:00",
-            "First.",
-            memo_date,
-            "/path/to/first.m4a",
-        )
+        for name in ("First", "Second"):
+            obsidian_dest.append_transcript(
+                file_path,
+                f"{name}.m4a",
+                "2025-01-30 14:30:00",
+                f"{name}.",
+                memo_date,
+                f"/path/to/{name.lower()}.m4a",
+            )
 
         with open(file_path, "r") as f:
             content = f.read()
 
-        assert "memo_count: 1" in content
+        # Frontmatter is not rewritten per append
+        assert "memo_count: 0" in content
 
-        # Append second memo
-        obsidian_dest.append_transcript(
-            file_path,
-            "Second.m4a",
-            "2025-01-30 15:00:00",
-            "Second.",
-            memo_date,
-            "/path/to/second.m4a",
-        )
+        obsidian_dest.cleanup()
 
         with open(file_path, "r") as f:
             content = f.read()
 
         assert "memo_count: 2" in content
+        assert "First." in content
+        assert "Second." in content
+
+    def test_memo_count_written_by_flush(self, obsidian_dest, obsidian_vault):
+        """Test that flush() keeps the count exact without waiting for cleanup."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+
+        for i in range(2):
+            obsidian_dest.append_transcript(
+                file_path, f"Memo{i}.m4a", "2025-01-30 14:30:00",
+                "Text.", memo_date, "/path/to/memo.m4a",
+            )
+            assert obsidian_dest.flush() == {}
+
+            with open(file_path, "r") as f:
+                assert f"memo_count: {i + 1}    \n" in f.read()
+
+        # Nothing left for cleanup to write
+        with patch.object(ObsidianDestination, "_update_memo_count") as mock_update:
+            obsidian_dest.cleanup()
+        mock_update.assert_not_called()
+
+    def test_memo_count_continues_existing_file(self, obsidian_config, config_dir):
+        """Test that a later run adds to the count already in the file."""
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+
+        for run in range(2):
+            dest = ObsidianDestination(obsidian_config, str(config_dir))
+            dest.initialize()
+            file_path = dest.prepare_for_memo(memo_date)
+            dest.append_transcript(
+                file_path, f"Run{run}.m4a", "2025-01-30 14:30:00",
+                "Text.", memo_date, "/path/to/memo.m4a",
+            )
+            dest.cleanup()
+
+        with open(file_path, "r") as f:
+            content = f.read()
+
+        assert "memo_count: 2" in content
+
+
+    def test_existing_count_read_once_in_prepare(self, obsidian_dest, obsidian_vault):
+        """Test that an existing file's header is read in prepare_for_memo only."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        existing = obsidian_vault / "Voice Memos" / "2025-01-30.md"
+        existing.write_text("---\ndate: 2025-01-30\nmemo_count: 3    \n---\n\n")
+
+        with patch.object(
+            ObsidianDestination, "_read_count_from_header",
+            autospec=True, side_effect=ObsidianDestination._read_count_from_header,
+        ) as mock_read:
+            for i in range(2):
+                file_path = obsidian_dest.prepare_for_memo(memo_date)
+                obsidian_dest.append_transcript(
+                    file_path, f"Memo{i}.m4a", "2025-01-30 14:30:00",
+                    "Text.", memo_date, "/path/to/memo.m4a",
+                )
+
+        assert mock_read.call_count == 1
+        assert obsidian_dest._files[file_path].count == 5
+        obsidian_dest.cleanup()
+
+    def test_file_without_memo_count_not_rewritten(self, obsidian_dest, obsidian_vault):
+        """Test that a frontmatter with the memo_count removed is left alone."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        edited = obsidian_vault / "Voice Memos" / "2025-01-30.md"
+        header = "---\ndate: 2025-01-30\n---\n\n# Voice Memos\n\n"
+        edited.write_text(header)
+
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "Memo.m4a", "2025-01-30 14:30:00", "Text.",
+            memo_date, "/path/to/memo.m4a",
+        )
+        with patch("builtins.open", wraps=open) as mock_open:
+            obsidian_dest.cleanup()
+
+        assert mock_open.call_count == 0
+        content = edited.read_text()
+        assert content.startswith(header)
+        assert "memo_count" not in content
+
+    def test_file_opened_once_per_session(self, obsidian_dest):
+        """Test that appends to the same file reuse one handle until cleanup."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            for i in range(3):
+                obsidian_dest.append_transcript(
+                    file_path, f"Memo{i}.m4a", "2025-01-30 14:30:00",
+                    f"Transcript {i}.", memo_date, "/path/to/memo.m4a",
+                )
+
+            # Written through immediately, not held until cleanup
+            with open(file_path, "r") as f:
+                assert "Transcript 2." in f.read()
+
+        append_opens = [c for c in mock_open.call_args_list if c.args[1:] == ("ab",)]
+        assert len(append_opens) == 1
+
+        obsidian_dest.cleanup()
+        assert obsidian_dest._files[file_path].handle is None
+
+    def test_memo_count_updated_in_place(self, obsidian_dest, obsidian_vault):
+        """Test that the fixed-width memo_count is overwritten without a file rewrite."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "First.m4a", "2025-01-30 14:30:00", "First.",
+            memo_date, "/path/to/first.m4a",
+        )
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            obsidian_dest.cleanup()
+
+        modes = [call.args[1] for call in mock_open.call_args_list if len(call.args) > 1]
+        assert modes == ["r+b"]
+        with open(file_path, "r") as f:
+            assert "memo_count: 1    \n" in f.read()
+
+    def test_legacy_memo_count_updated_in_place(self, obsidian_dest, obsidian_vault):
+        """Test that an unpadded memo_count is overwritten in place while it fits."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        legacy = obsidian_vault / "Voice Memos" / "2025-01-30.md"
+        legacy.write_text(
+            "---\ndate: 2025-01-30\nmemo_count: 3\n---\n\n# Voice Memos\n\n"
+        )
+
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "Fourth.m4a", "2025-01-30 14:30:00", "Fourth.",
+            memo_date, "/path/to/fourth.m4a",
+        )
+        with patch("builtins.open", wraps=open) as mock_open:
+            obsidian_dest.cleanup()
+
+        modes = [call.args[1] for call in mock_open.call_args_list if len(call.args) > 1]
+        assert modes == ["r+b"]
+        content = legacy.read_text()
+        assert "memo_count: 4\n" in content
+        assert content.endswith("Fourth.\n\n")
+
+    def test_legacy_memo_count_widened(self, obsidian_dest, obsidian_vault):
+        """Test that a count outgrowing an unpadded field is rewritten as fixed-width."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        legacy = obsidian_vault / "Voice Memos" / "2025-01-30.md"
+        legacy.write_text(
+            "---\ndate: 2025-01-30\nmemo_count: 9\n---\n\n# Voice Memos\n\n"
+        )
+
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "Tenth.m4a", "2025-01-30 14:30:00", "Tenth.",
+            memo_date, "/path/to/tenth.m4a",
+        )
+        obsidian_dest.cleanup()
+
+        content = legacy.read_text()
+        assert "memo_count: 10   \n" in content
+        assert content.endswith("Tenth.\n\n")
+
+    @pytest.mark.parametrize("stored", ["1", "9", None])
+    def test_memo_count_in_transcript_untouched(self, obsidian_dest, obsidian_vault, stored):
+        """Test that only a memo_count inside the frontmatter is ever rewritten."""
+        obsidian_dest.initialize()
+        memo_date = datetime(2025, 1, 30, 14, 30, 0)
+        frontmatter = f"memo_count: {stored}\n" if stored else "date: 2025-01-30\n"
+        legacy = obsidian_vault / "Voice Memos" / "2025-01-30.md"
+        legacy.write_text(f"---\n{frontmatter}---\n\n# Voice Memos\n\nmemo_count: 7\n\n")
+
+        file_path = obsidian_dest.prepare_for_memo(memo_date)
+        obsidian_dest.append_transcript(
+            file_path, "Notes.m4a", "2025-01-30 14:30:00", "memo_count: 8",
+            memo_date, "/path/to/notes.m4a",
+        )
+        obsidian_dest.cleanup()
+
+        content = legacy.read_text()
+        assert content.count("\nmemo_count: 7\n") == 1
+        assert content.count("\nmemo_count: 8\n") == 1
+        if stored:
+            expected = {"1": "memo_count: 2\n", "9": "memo_count: 10   \n"}[stored]
+            assert content.startswith(f"---\n{expected}---\n")
 
 
 @pytest.mark.unit
@@ -1,11 +1,26 @@
 """Tests for destination utilities."""
 
 import json
+import sys
+import struct
 import subprocess
+from datetime import date, datetime
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 
-from destinations.utils import extract_audio_metadata, format_duration
+from destinations.utils import (
+    METADATA_CACHE_FILENAME,
+    close_metadata_cache,
+    extract_audio_metadata,
+    extract_audio_metadata_batch,
+    format_day,
+    format_duration,
+    init_metadata_cache,
+    loads_json,
+    monday_of,
+    mp4_duration,
+)
 
 
 def test_extract_audio_metadata_success():
@@ -95,6 +110,209 @@ def test_extract_audio_metadata_invalid_json():
         assert metadata == {}
 
 
+def test_extract_audio_metadata_parses_bytes_output():
+    """Test that ffprobe output is parsed as raw bytes (no text decoding)."""
+    output = {"format": {"duration": "3.5", "tags": {"title": "Caf\u00e9"}}}
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps(output, ensure_ascii=False).encode("utf-8")
+        )
+
+        metadata = extract_audio_metadata("/path/to/audio.m4a")
+
+    assert "text" not in mock_run.call_args.kwargs
+    assert metadata == {"title": "Caf\u00e9", "duration": 3.5}
+
+
+def test_loads_json_without_orjson():
+    """Test that JSON is parsed with the json module when orjson isn't installed."""
+    from destinations import utils
+
+    utils._json_loader.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert utils._json_loader() is json.loads
+            assert loads_json(b'["a", "b"]') == ["a", "b"]
+            with pytest.raises(ValueError):
+                loads_json(b"not json")
+    finally:
+        utils._json_loader.cache_clear()
+
+
+@pytest.fixture
+def metadata_cache(config_dir):
+    """Enable the on-disk metadata cache for a test."""
+    init_metadata_cache(str(config_dir))
+    yield config_dir / METADATA_CACHE_FILENAME
+    close_metadata_cache()
+
+
+def _ffprobe_result(title):
+    return MagicMock(
+        returncode=0,
+        stdout=json.dumps({"format": {"duration": "12.0", "tags": {"title": title}}}),
+    )
+
+
+def test_extract_audio_metadata_cached_across_runs(metadata_cache, sample_audio_file, config_dir):
+    """Test that an unchanged file is only probed once, even across runs."""
+    with patch("subprocess.run", return_value=_ffprobe_result("Cached")) as mock_run:
+        first = extract_audio_metadata(str(sample_audio_file))
+        close_metadata_cache()
+        assert metadata_cache.exists()
+
+        init_metadata_cache(str(config_dir))
+        second = extract_audio_metadata(str(sample_audio_file))
+
+    assert first == second == {"title": "Cached", "duration": 12.0}
+    assert mock_run.call_count == 1
+    assert "-show_streams" not in mock_run.call_args[0][0]
+
+
+def test_extract_audio_metadata_reprobes_changed_file(metadata_cache, sample_audio_file):
+    """Test that a modified file gets fresh metadata."""
+    with patch("subprocess.run", return_value=_ffprobe_result("Old")):
+        extract_audio_metadata(str(sample_audio_file))
+
+    with open(sample_audio_file, "ab") as f:
+        f.write(b"\x00" * 16)
+
+    with patch("subprocess.run", return_value=_ffprobe_result("New")):
+        assert extract_audio_metadata(str(sample_audio_file))["title"] == "New"
+
+
+def test_extract_audio_metadata_failures_not_cached(metadata_cache, sample_audio_file):
+    """Test that a failed probe is retried on the next call."""
+    with patch("subprocess.run", side_effect=FileNotFoundError):
+        assert extract_audio_metadata(str(sample_audio_file)) == {}
+
+    with patch("subprocess.run", return_value=_ffprobe_result("Retried")) as mock_run:
+        assert extract_audio_metadata(str(sample_audio_file))["title"] == "Retried"
+    mock_run.assert_called_once()
+
+
+def test_extract_audio_metadata_batch(metadata_cache, temp_dir):
+    """Test batch extraction probes only uncached files and keeps results per path."""
+    paths = []
+    for name in ("a", "b", "c"):
+        path = temp_dir / f"{name}.m4a"
+        path.write_bytes(name.encode() * 10)
+        paths.append(str(path))
+
+    with patch("subprocess.run", return_value=_ffprobe_result("A")):
+        extract_audio_metadata(paths[0])
+
+    def probe(cmd, **kwargs):
+        return _ffprobe_result(Path(cmd[-1]).stem.upper())
+
+    with patch("subprocess.run", side_effect=probe) as mock_run:
+        results = extract_audio_metadata_batch(paths + [paths[1]])
+
+    assert {path: md["title"] for path, md in results.items()} == dict(zip(paths, "ABC"))
+    # a.m4a came from the cache; b.m4a is probed once despite being listed twice
+    assert mock_run.call_count == 2
+
+
+def _atom(atom_type, payload):
+    return struct.pack(">I4s", 8 + len(payload), atom_type) + payload
+
+
+def _write_m4a(path, title=None, encoder=None, duration=204.5, version=0,
+               created=3821073332):  # 2025-01-30T09:15:32Z, in seconds since 1904
+    """Write a minimal M4A: ftyp, mdat, then moov with mvhd and ilst metadata."""
+    if version == 1:
+        mvhd = b"\x01\x00\x00\x00" + struct.pack(">QQIQ", created, created, 1000, int(duration * 1000))
+    else:
+        mvhd = b"\x00\x00\x00\x00" + struct.pack(">IIII", created, created, 1000, int(duration * 1000))
+
+    items = b""
+    for item_type, value in ((b"\xa9nam", title), (b"\xa9too", encoder)):
+        if value is not None:
+            data = struct.pack(">II", 1, 0) + value.encode("utf-8")
+            items += _atom(item_type, _atom(b"data", data))
+    meta = _atom(b"meta", b"\x00\x00\x00\x00" + _atom(b"hdlr", b"\x00" * 25) + _atom(b"ilst", items))
+
+    moov = _atom(b"moov", _atom(b"mvhd", mvhd + b"\x00" * 80) + _atom(b"udta", meta))
+    path.write_bytes(_atom(b"ftyp", b"M4A \x00\x00\x00\x00") + _atom(b"mdat", b"\x00" * 2048) + moov)
+
+
+@pytest.mark.parametrize("version", [0, 1])
+def test_extract_audio_metadata_parses_m4a_without_ffprobe(temp_dir, version):
+    """Test that MP4 atoms are read directly, without spawning ffprobe."""
+    path = temp_dir / "memo.m4a"
+    _write_m4a(path, title="Meeting Notes", encoder="iPhone Version 18.1.1", version=version)
+
+    with patch("subprocess.run") as mock_run:
+        metadata = extract_audio_metadata(str(path))
+
+    mock_run.assert_not_called()
+    assert metadata == {
+        "title": "Meeting Notes",
+        "duration": 204.5,
+        "creation_time": "2025-01-30T09:15:32.000000Z",
+        "device": "iPhone Version 18.1.1",
+    }
+
+
+def test_extract_audio_metadata_m4a_bad_creation_time(temp_dir):
+    """Test that a 64-bit creation time past datetime's range is dropped, not raised."""
+    path = temp_dir / "memo.m4a"
+    _write_m4a(path, title="Meeting Notes", version=1, created=2**63)
+
+    with patch("subprocess.run") as mock_run:
+        metadata = extract_audio_metadata(str(path))
+
+    mock_run.assert_not_called()
+    assert metadata == {"title": "Meeting Notes", "duration": 204.5}
+
+
+def test_extract_audio_metadata_m4a_without_tags(temp_dir):
+    """Test an M4A with no title and a non-Apple encoder."""
+    path = temp_dir / "memo.m4a"
+    _write_m4a(path, encoder="Lavf60.3.100", duration=12.0)
+
+    metadata = extract_audio_metadata(str(path))
+
+    assert metadata["duration"] == 12.0
+    assert "title" not in metadata
+    assert "device" not in metadata
+
+
+def test_mp4_duration(temp_dir):
+    """Test that a well-formed M4A's duration is read from its atoms."""
+    path = temp_dir / "memo.m4a"
+    _write_m4a(path, duration=12.0)
+
+    assert mp4_duration(str(path)) == 12.0
+
+
+def test_mp4_duration_rejects_incomplete_files(temp_dir, sample_audio_file, corrupted_audio_file):
+    """Test that files without moov and media data, or with bad atoms, give None."""
+    no_media = temp_dir / "no_media.m4a"
+    _write_m4a(no_media)
+    data = no_media.read_bytes()
+    # Drop the 2KB mdat, keeping ftyp and moov
+    no_media.write_bytes(data[:16] + data[16 + 8 + 2048:])
+
+    truncated = temp_dir / "truncated.m4a"
+    _write_m4a(truncated)
+    truncated.write_bytes(truncated.read_bytes()[:-10])
+
+    for path in (no_media, truncated, sample_audio_file, corrupted_audio_file):
+        assert mp4_duration(str(path)) is None
+    assert mp4_duration(str(temp_dir / "missing.m4a")) is None
+
+
+def test_extract_audio_metadata_falls_back_to_ffprobe(sample_audio_file):
+    """Test that files the atom parser can't read still go through ffprobe."""
+    with patch("subprocess.run", return_value=_ffprobe_result("Probed")) as mock_run:
+        metadata = extract_audio_metadata(str(sample_audio_file))
+
+    mock_run.assert_called_once()
+    assert metadata["title"] == "Probed"
+
+
 def test_format_duration_seconds_only():
     """Test formatting duration with only seconds."""
     assert format_duration(45) == "45s"
@@ -113,3 +331,18 @@ def test_format_duration_hours():
     assert format_duration(3665) == "1h 1m 5s"
     assert format_duration(3600) == "1h 0m 0s"
     assert format_duration(7325) == "2h 2m 5s"
+
+
+def test_monday_of():
+    """Test that the week start is a Monday date, across month and year boundaries."""
+    assert monday_of(datetime(2025, 1, 30, 23, 59)) == date(2025, 1, 27)
+    assert monday_of(date(2025, 1, 27)) == date(2025, 1, 27)
+    assert monday_of(datetime(2025, 1, 1)) == date(2024, 12, 30)
+
+
+def test_format_day():
+    """Test memoized day formatting."""
+    ordinal = date(2025, 1, 30).toordinal()
+
+    assert format_day("%B %d, %Y", ordinal) == "January 30, 2025"
+    assert format_day("%Y%m%d", ordinal) == "20250130"
@@ -130,6 +130,109 @@ class TestProcessedMemos:
         loaded = get_processed_memos()
         assert loaded == original
 
+    def test_save_appends_new_hashes_in_place(self, config_dir, monkeypatch, mock_config):
+        """Test that saving a grown set only writes the new hashes."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        processed = {"hash_a", "hash_b"}
+        save_processed_memos(processed)
+
+        processed.add("hash_c")
+        with patch("builtins.open", wraps=open) as mock_open:
+            save_processed_memos(processed)
+        assert [call.args[1] for call in mock_open.call_args_list] == ["r+b"]
+
+        with open(config_dir / "processed.json") as f:
+            assert set(json.load(f)) == {"hash_a", "hash_b", "hash_c"}
+
+    @pytest.mark.parametrize("content", [
+        '["hash_a", "hash_b"',
+        '["hash_a", "hash_b", ',
+        '["hash_a", "hash_b", "hash_',
+    ])
+    def test_get_recovers_truncated_file(self, content, config_dir, monkeypatch, mock_config):
+        """Test that an append cut short keeps the complete entries before it."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        processed_path = config_dir / "processed.json"
+        processed_path.write_text(content)
+
+        assert get_processed_memos() == {"hash_a", "hash_b"}
+
+        # The next save rewrites the file in full, so it parses again
+        save_processed_memos({"hash_a", "hash_b", "hash_c"})
+        with open(processed_path) as f:
+            assert set(json.load(f)) == {"hash_a", "hash_b", "hash_c"}
+
+    def test_interrupted_append_keeps_saved_hashes(self, config_dir, monkeypatch, mock_config):
+        """Test that an append failing partway doesn't lose earlier hashes."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        processed = {"hash_a", "hash_b"}
+        save_processed_memos(processed)
+
+        real_open = open
+
+        def torn_open(path, mode="r", *args, **kwargs):
+            f = real_open(path, mode, *args, **kwargs)
+            if mode == "r+b":
+                real_write = f.write
+
+                def write(data):
+                    real_write(data[:len(data) // 2])
+                    raise OSError(28, "No space left on device")
+
+                f.write = write
+            return f
+
+        processed.add("hash_c_with_a_long_name")
+        with patch("builtins.open", side_effect=torn_open):
+            with pytest.raises(OSError):
+                save_processed_memos(processed)
+
+        assert get_processed_memos() == {"hash_a", "hash_b"}
+        save_processed_memos(processed)
+        with open(config_dir / "processed.json") as f:
+            assert set(json.load(f)) == processed
+
+    def test_get_skips_parse_of_unchanged_file(self, config_dir, monkeypatch, mock_config):
+        """Test that a processed.json this process just wrote isn't re-read."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        save_processed_memos({"hash_a", "hash_b"})
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            loaded = get_processed_memos()
+        mock_open.assert_not_called()
+        assert loaded == {"hash_a", "hash_b"}
+
+        # Callers get their own copy to mutate
+        loaded.add("hash_c")
+        assert get_processed_memos() == {"hash_a", "hash_b"}
+
+    def test_save_rewrites_file_changed_elsewhere(self, config_dir, monkeypatch, mock_config):
+        """Test that a processed.json edited outside this process is rewritten in full."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        processed = {"hash_a"}
+        save_processed_memos(processed)
+
+        processed_path = config_dir / "processed.json"
+        processed_path.write_text('[\n  "hash_x"\n]\n')
+
+        processed.add("hash_b")
+        save_processed_memos(processed)
+
+        with open(processed_path) as f:
+            assert set(json.load(f)) == {"hash_a", "hash_b"}
+
+
+    def test_save_rewrite_leaves_old_file_on_failure(self, config_dir, monkeypatch, mock_config):
+        """Test that a failed full rewrite keeps the previous processed.json."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        processed_path = config_dir / "processed.json"
+        processed_path.write_text('["hash_a"]')
+
+        with patch("json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_processed_memos({"hash_a", "hash_b"})
+
+        assert get_processed_memos() == {"hash_a"}
 
 @pytest.mark.unit
 class TestAudioValidation:
@@ -158,6 +261,16 @@ class TestAudioValidation:
         assert isinstance(is_valid, bool)
         assert isinstance(error_msg, str)
 
+    def test_validate_m4a_without_ffprobe(self, sample_audio_file):
+        """Test that a well-formed M4A is accepted without spawning ffprobe."""
+        with patch("transcribe_memos.mp4_duration", return_value=12.0), \
+                patch("subprocess.run") as mock_run:
+            is_valid, error_msg = validate_audio_file(str(sample_audio_file))
+
+        assert is_valid
+        assert error_msg == ""
+        mock_run.assert_not_called()
+
     def test_validate_nonexistent_file(self):
         """Test validation fails for nonexistent file."""
         is_valid, error_msg = validate_audio_file("/nonexistent/file.m4a")
@@ -85,6 +85,49 @@ class TestFindNewMemos:
         timestamps = [memo[2] for memo in result]
         assert timestamps == sorted(timestamps)
 
+    def test_find_new_memos_searches_subfolders(self, temp_dir, monkeypatch, mock_config):
+        """Test that .m4a files in subfolders are found and other files ignored."""
+        memos_dir = temp_dir / "voice_memos"
+        (memos_dir / "2025" / "January").mkdir(parents=True)
+        mock_config["voice_memos_path"] = str(memos_dir)
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        nested = memos_dir / "2025" / "January" / "Meeting.notes.m4a"
+        nested.write_bytes(b"test" * 1000)
+        (memos_dir / "top.m4a").write_bytes(b"test" * 1000)
+        (memos_dir / "notes.txt").write_text("not audio")
+        (memos_dir / "folder.m4a").mkdir()
+
+        from transcribe_memos import get_file_hash, save_processed_memos
+
+        result = find_new_memos()
+
+        assert sorted(name for _, name, _ in result) == ["Meeting.notes", "top"]
+        assert str(nested) in {filepath for filepath, _, _ in result}
+
+        # Found files hash the same as get_file_hash, so processed ones are skipped
+        save_processed_memos({get_file_hash(str(nested))})
+        assert [name for _, name, _ in find_new_memos()] == ["top"]
+
+    def test_find_new_memos_skips_symlinked_folders(self, temp_dir, monkeypatch, mock_config):
+        """Test that directory symlinks, including loops, are not walked."""
+        memos_dir = temp_dir / "voice_memos"
+        (memos_dir / "a").mkdir(parents=True)
+        mock_config["voice_memos_path"] = str(memos_dir)
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        recording = memos_dir / "a" / "x.m4a"
+        recording.write_bytes(b"test" * 1000)
+        try:
+            (memos_dir / "a" / "loop").symlink_to(memos_dir / "a", target_is_directory=True)
+            (memos_dir / "linked").symlink_to(memos_dir / "a", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        result = find_new_memos()
+
+        assert [filepath for filepath, _, _ in result] == [str(recording)]
+
 
 @pytest.mark.integration
 @pytest.mark.slow
@@ -242,3 +285,223 @@ class TestErrorRecovery:
         new_memos = find_new_memos()
         new_memo_paths = [path for path, _, _ in new_memos]
         assert first_memo not in new_memo_paths
+
+    def test_commit_pending_memos_marks_processed(self, config_dir, monkeypatch, mock_config):
+        """Test that flushed memos are marked as processed."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        from transcribe_memos import commit_pending_memos, get_processed_memos
+
+        destination = MagicMock()
+        destination.flush.return_value = {}
+        pending = [("/m/memo1.m4a", "memo1", "hash1"), ("/m/memo2.m4a", "memo2", "hash2")]
+        processed = set()
+
+        failed = commit_pending_memos(destination, pending, processed)
+
+        assert failed == []
+        assert pending == []
+        destination.flush.assert_called_once()
+        assert get_processed_memos() == {"hash1", "hash2"}
+
+    def test_commit_pending_memos_flush_failure(self, config_dir, monkeypatch, mock_config):
+        """Test that memos are not marked as processed when the flush fails."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        from transcribe_memos import commit_pending_memos
+
+        destination = MagicMock()
+        destination.flush.side_effect = RuntimeError("API unavailable")
+        pending = [("/m/memo1.m4a", "memo1", "hash1"), ("/m/memo2.m4a", "memo2", "hash2")]
+        processed = set()
+
+        failed = commit_pending_memos(destination, pending, processed)
+
+        assert failed == ["memo1", "memo2"]
+        assert pending == []
+        assert processed == set()
+        assert not (config_dir / "processed.json").exists()
+
+    def test_commit_pending_memos_partial_flush(self, config_dir, monkeypatch, mock_config):
+        """Test that only the memos the destination reports unwritten are retried."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        from transcribe_memos import commit_pending_memos, get_processed_memos
+
+        destination = MagicMock()
+        destination.flush.return_value = {"/m/memo2.m4a": RuntimeError("quota exceeded")}
+        pending = [("/m/memo1.m4a", "memo1", "hash1"), ("/m/memo2.m4a", "memo2", "hash2")]
+
+        failed = commit_pending_memos(destination, pending, set())
+
+        assert failed == ["memo2"]
+        assert pending == []
+        assert get_processed_memos() == {"hash1"}
+
+
+@pytest.fixture
+def docs_run(monkeypatch, mock_config):
+    """Set up main() against a mocked Google Docs destination.
+
+    Returns (add_memo, writes): add_memo(name, when) creates a memo file
+    recorded at `when`; writes collects the insertText batches sent, one
+    list of (tab_id, text) pairs per batchUpdate.
+    """
+    from destinations.google_docs import GoogleDocsDestination
+
+    mock_config["destination"] = {
+        "type": "google_docs",
+        "google_docs": {"doc_id": "doc-1", "tab_date_format": "%B %d, %Y"},
+    }
+    monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+    writes = []
+    service = MagicMock()
+    service.documents().get.return_value.execute.return_value = {"tabs": []}
+
+    def batch_update(documentId, body):
+        request = MagicMock()
+        first = body["requests"][0]
+        if "addDocumentTab" in first:
+            title = first["addDocumentTab"]["tabProperties"]["title"]
+            request.execute.return_value = {
+                "replies": [{"addDocumentTab": {"tabId": f"tab {title}"}}]
+            }
+        else:
+            writes.append([
+                (r["insertText"]["endOfSegmentLocation"].get("tabId"), r["insertText"]["text"])
+                for r in body["requests"]
+            ])
+        return request
+
+    service.documents().batchUpdate.side_effect = batch_update
+
+    def initialize(self):
+        self.service = service
+
+    monkeypatch.setattr(GoogleDocsDestination, "initialize", initialize)
+
+    def add_memo(name, when):
+        path = Path(mock_config["voice_memos_path"]) / f"{name}.m4a"
+        path.write_bytes(b"\x00" * 2000)
+        os.utime(path, (when.timestamp(), when.timestamp()))
+        return str(path)
+
+    return add_memo, writes
+
+
+@pytest.mark.integration
+class TestMainWorkflow:
+    """Test main() end to end with a mocked destination and backend."""
+
+    def test_new_tab_header_written_with_first_entry(self, docs_run):
+        """Test that a new tab's header and first transcript share a batchUpdate."""
+        from transcribe_memos import main
+
+        add_memo, writes = docs_run
+        add_memo("a", datetime(2025, 1, 31, 9, 0))
+        bad = add_memo("b", datetime(2025, 2, 1, 9, 0))
+        add_memo("c", datetime(2025, 2, 1, 10, 0))
+
+        def fake_transcribe(audio_path, *args, **kwargs):
+            if audio_path == bad:
+                raise RuntimeError("API unavailable")
+            return f"Text of {Path(audio_path).stem}"
+
+        with patch("transcribe_memos.transcribe", side_effect=fake_transcribe):
+            main()
+
+        # memo b failed after its tab was created: no header is written on
+        # its own, it goes out with memo c instead
+        (batch,) = writes
+        assert len(batch) == 4
+        for (header, entry), (tab_id, text) in zip(zip(batch[::2], batch[1::2]), [
+            ("tab January 31, 2025", "Text of a"),
+            ("tab February 01, 2025", "Text of c"),
+        ]):
+            assert [header[0], entry[0]] == [tab_id, tab_id]
+            assert header[1].startswith("📅 " + tab_id[4:])
+            assert text in entry[1]
+
+    def test_buffered_memos_flushed_across_sessions(self, monkeypatch, mock_config):
+        """Test that moving to another doc/tab doesn't flush; flush_every does."""
+        from transcribe_memos import get_processed_memos, main
+
+        mock_config["destination"] = {"type": "test", "test": {}}
+        mock_config["flush_every"] = 2
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        for i in range(3):
+            path = Path(mock_config["voice_memos_path"]) / f"memo{i}.m4a"
+            path.write_bytes(b"\x00" * 2000)
+            os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+
+        destination = MagicMock()
+        destination.get_session_id.side_effect = ["doc-a", "doc-b", "doc-c"]
+        destination.has_pending_writes.return_value = True
+        queued = []
+        destination.append_transcript.side_effect = (
+            lambda session_id, memo_name, *args: queued.append(memo_name)
+        )
+        flushed = []
+        destination.flush.side_effect = lambda: flushed.append(list(queued))
+
+        with patch("transcribe_memos.create_destination", return_value=destination), \
+                patch("transcribe_memos.transcribe", return_value="Text"):
+            main()
+
+        # memo0 and memo1 went to different docs but were written together
+        assert flushed == [["memo0", "memo1"], ["memo0", "memo1", "memo2"]]
+        assert len(get_processed_memos()) == 3
+
+    def test_buffered_memo_reported_after_flush(self, monkeypatch, mock_config, capsys):
+        """Test that a queued memo is reported done or failed only once flushed."""
+        from transcribe_memos import get_processed_memos, main
+
+        mock_config["destination"] = {"type": "test", "test": {}}
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        for name in ("ok", "bad"):
+            (Path(mock_config["voice_memos_path"]) / f"{name}.m4a").write_bytes(b"\x00" * 2000)
+
+        destination = MagicMock()
+        destination.get_session_id.return_value = "session"
+        destination.has_pending_writes.return_value = True
+        bad_path = str(Path(mock_config["voice_memos_path"]) / "bad.m4a")
+        destination.flush.return_value = {bad_path: RuntimeError("quota exceeded")}
+
+        with patch("transcribe_memos.create_destination", return_value=destination), \
+                patch("transcribe_memos.transcribe", return_value="Text"):
+            main()
+
+        out = capsys.readouterr().out
+        assert out.count("⏳ Queued") == 2
+        memo_output, flush_output = out.split("💾 Writing 2 queued memo(s)...")
+        assert "✅ Done!" not in memo_output
+        assert "✅ Done! 1 memo(s) written" in flush_output
+        assert "quota exceeded" in flush_output
+        assert "Success: 1/2 memos" in out
+        assert "Failed: 1/2 memos" in out
+        assert len(get_processed_memos()) == 1
+
+    def test_failed_immediate_flush_not_counted_as_success(self, monkeypatch, mock_config, capsys):
+        """Test that a memo whose write fails is reported as failed, not done."""
+        from transcribe_memos import get_processed_memos, main
+
+        mock_config["destination"] = {"type": "test", "test": {}}
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        path = Path(mock_config["voice_memos_path"]) / "memo.m4a"
+        path.write_bytes(b"\x00" * 2000)
+
+        destination = MagicMock()
+        destination.get_session_id.return_value = "session"
+        destination.has_pending_writes.return_value = False
+        destination.flush.side_effect = RuntimeError("write failed")
+
+        with patch("transcribe_memos.create_destination", return_value=destination), \
+                patch("transcribe_memos.transcribe", return_value="Text"):
+            main()
+
+        out = capsys.readouterr().out
+        assert "✅ Done!" not in out
+        assert "Success: 0/1 memos" in out
+        assert "Failed: 1/1 memos" in out
+        assert get_processed_memos() == set()
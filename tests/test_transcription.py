@@ -2,12 +2,15 @@
 
 import os
 import pytest
+from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from transcribe_memos import (
+    transcribe_ahead,
+    transcribe_local,
     transcribe_openai,
     split_audio_file,
     validate_audio_file,
@@ -39,6 +42,25 @@ class TestTranscriptionOpenAI:
         assert result == "Test transcription text"
         mock_client.audio.transcriptions.create.assert_called_once()
 
+    @patch('openai.OpenAI')
+    @patch('transcribe_memos.validate_audio_file')
+    @patch('transcribe_memos.split_audio_file')
+    def test_client_reused_across_memos(self, mock_split, mock_validate, mock_openai_class, sample_audio_file, monkeypatch, mock_config):
+        """Test that one OpenAI client serves every memo with the same key."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        mock_validate.return_value = (True, "")
+        mock_split.return_value = [str(sample_audio_file)]
+        mock_openai_class.return_value.audio.transcriptions.create.return_value.text = "Memo"
+
+        transcribe_openai(str(sample_audio_file))
+        transcribe_openai(str(sample_audio_file))
+        mock_openai_class.assert_called_once_with(api_key="sk-test-key-12345")
+
+        # A new key gets a new client
+        mock_config["openai_api_key"] = "sk-other-key"
+        transcribe_openai(str(sample_audio_file))
+        assert mock_openai_class.call_count == 2
+
     @patch('transcribe_memos.validate_audio_file')
     def test_transcribe_openai_no_api_key(self, mock_validate, sample_audio_file, monkeypatch, mock_config):
         """Test transcription fails without API key."""
@@ -80,6 +102,192 @@ class TestTranscriptionOpenAI:
         assert not result.endswith(" ")
 
 
+    @patch('openai.OpenAI')
+    @patch('transcribe_memos.validate_audio_file')
+    @patch('transcribe_memos.split_audio_file')
+    def test_transcribe_openai_chunks_joined_in_order(self, mock_split, mock_validate, mock_openai_class, temp_dir, monkeypatch, mock_config):
+        """Test that chunks transcribed concurrently are joined in chunk order."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        mock_validate.return_value = (True, "")
+
+        chunk_dir = temp_dir / "chunks"
+        chunk_dir.mkdir()
+        chunks = []
+        for i in range(5):
+            chunk_path = chunk_dir / f"chunk_{i:03d}.m4a"
+            chunk_path.write_bytes(b"chunk")
+            chunks.append(str(chunk_path))
+        mock_split.return_value = chunks
+
+        def create(model, file):
+            response = MagicMock()
+            response.text = f" part {os.path.basename(file.name)[6:9]} "
+            return response
+
+        mock_client = MagicMock()
+        mock_client.audio.transcriptions.create.side_effect = create
+        mock_openai_class.return_value = mock_client
+
+        result = transcribe_openai(str(temp_dir / "long_memo.m4a"))
+
+        assert result == "part 000 part 001 part 002 part 003 part 004"
+        assert mock_client.audio.transcriptions.create.call_count == 5
+        # Temporary chunks are still cleaned up
+        assert not chunk_dir.exists()
+
+@pytest.mark.unit
+class TestTranscriptionLocal:
+    """Test local Whisper transcription."""
+
+    def test_model_loaded_once_per_batch(self, sample_audio_file, monkeypatch, mock_config):
+        """Test that the Whisper model is loaded on the first memo only."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value.transcribe.return_value = {"text": " Hello "}
+
+        with patch.dict(sys.modules, {"whisper": mock_whisper, "faster_whisper": None}), \
+                patch.dict("transcribe_memos._whisper_models", clear=True):
+            first = transcribe_local(str(sample_audio_file))
+            second = transcribe_local(str(sample_audio_file))
+
+        assert first == second == "Hello"
+        mock_whisper.load_model.assert_called_once_with("small")
+
+    def test_auto_uses_faster_whisper_when_installed(self, sample_audio_file, monkeypatch, mock_config):
+        """Test that "auto" picks faster-whisper and joins its segments."""
+        mock_config["local_impl"] = "auto"
+        mock_config["whisper_compute_type"] = "float32"
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        mock_faster_whisper = MagicMock()
+        segments = [MagicMock(text=" Hello"), MagicMock(text=" world. ")]
+        mock_model = mock_faster_whisper.WhisperModel.return_value
+        mock_model.transcribe.return_value = (iter(segments), MagicMock())
+
+        with patch.dict(sys.modules, {"faster_whisper": mock_faster_whisper}), \
+                patch.dict("transcribe_memos._whisper_models", clear=True):
+            result = transcribe_local(str(sample_audio_file))
+
+        assert result == "Hello world."
+        mock_faster_whisper.WhisperModel.assert_called_once_with(
+            "small", device="auto", compute_type="float32"
+        )
+
+    def test_default_keeps_openai_whisper(self, sample_audio_file, monkeypatch, mock_config):
+        """Test that an installed faster-whisper isn't used unless configured."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value.transcribe.return_value = {"text": "Hi"}
+        mock_faster_whisper = MagicMock()
+
+        with patch.dict(sys.modules, {"whisper": mock_whisper, "faster_whisper": mock_faster_whisper}), \
+                patch.dict("transcribe_memos._whisper_models", clear=True):
+            assert transcribe_local(str(sample_audio_file)) == "Hi"
+
+        mock_faster_whisper.WhisperModel.assert_not_called()
+
+    def test_faster_requires_faster_whisper(self, sample_audio_file, monkeypatch, mock_config):
+        """Test that "faster" fails instead of silently using openai-whisper."""
+        mock_config["local_impl"] = "faster"
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        with patch.dict(sys.modules, {"whisper": MagicMock(), "faster_whisper": None}), \
+                patch.dict("transcribe_memos._whisper_models", clear=True):
+            with pytest.raises(ImportError):
+                transcribe_local(str(sample_audio_file))
+
+
+@pytest.mark.unit
+class TestTranscribeAhead:
+    """Test transcription of upcoming memos in the background."""
+
+    @staticmethod
+    def _memos(temp_dir, names, size=2000):
+        paths = []
+        for name in names:
+            path = temp_dir / name
+            path.write_bytes(b"\x00" * size)
+            paths.append(str(path))
+        return paths
+
+    def test_results_in_order_with_errors(self, temp_dir, monkeypatch, mock_config):
+        """Test that transcripts come back in memo order and errors re-raise."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        paths = self._memos(temp_dir, ["a.m4a", "bad.m4a", "c.m4a", "d.m4a", "e.m4a", "f.m4a"])
+
+        def fake_transcribe(audio_path, log=print, max_parallel_chunks=None):
+            name = os.path.basename(audio_path)
+            if name == "bad.m4a":
+                raise ValueError("Corrupted audio file: broken")
+            return f"text of {name}"
+
+        with patch("transcribe_memos.transcribe", side_effect=fake_transcribe) as mock_transcribe:
+            results = []
+            for get_transcript in transcribe_ahead(paths):
+                try:
+                    results.append(get_transcript())
+                except ValueError as e:
+                    results.append(str(e))
+
+        assert results == [
+            "text of a.m4a",
+            "Corrupted audio file: broken",
+            "text of c.m4a",
+            "text of d.m4a",
+            "text of e.m4a",
+            "text of f.m4a",
+        ]
+        assert mock_transcribe.call_count == len(paths)
+        # Memos running ahead send their chunks one at a time
+        for call in mock_transcribe.call_args_list:
+            assert call.kwargs["max_parallel_chunks"] == 1
+
+    def test_progress_printed_with_its_memo(self, temp_dir, monkeypatch, mock_config, capsys):
+        """Test that background progress is printed when its memo's result is read."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        paths = self._memos(temp_dir, ["a.m4a", "b.m4a", "c.m4a"])
+
+        def fake_transcribe(audio_path, log=print, max_parallel_chunks=None):
+            log(f"  Sending {os.path.basename(audio_path)}...")
+            return "text"
+
+        with patch("transcribe_memos.transcribe", side_effect=fake_transcribe):
+            for path, get_transcript in zip(paths, transcribe_ahead(paths)):
+                print(f"Processing {os.path.basename(path)}")
+                get_transcript()
+
+        assert capsys.readouterr().out.splitlines() == [
+            "Processing a.m4a", "  Sending a.m4a...",
+            "Processing b.m4a", "  Sending b.m4a...",
+            "Processing c.m4a", "  Sending c.m4a...",
+        ]
+
+    def test_small_files_not_sent_ahead(self, temp_dir, monkeypatch, mock_config):
+        """Test that files main() would skip as too small aren't transcribed."""
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+        paths = self._memos(temp_dir, ["a.m4a", "b.m4a"])
+        tiny = self._memos(temp_dir, ["tiny.m4a"], size=10)[0]
+
+        with patch("transcribe_memos.transcribe", return_value="text") as mock_transcribe:
+            transcripts = list(transcribe_ahead([paths[0], tiny, paths[1]]))
+            assert transcripts[0]() == "text"
+            assert transcripts[2]() == "text"
+
+        assert [call.args[0] for call in mock_transcribe.call_args_list] == paths
+
+    def test_local_backend_transcribes_on_demand(self, monkeypatch, mock_config):
+        """Test that local Whisper only transcribes when a result is asked for."""
+        mock_config["backend"] = "local"
+        monkeypatch.setattr("transcribe_memos.CONFIG", mock_config)
+
+        with patch("transcribe_memos.transcribe", return_value="text") as mock_transcribe:
+            transcripts = transcribe_ahead(["a.m4a", "b.m4a"])
+            get_transcript = next(transcripts)
+            mock_transcribe.assert_not_called()
+
+            assert get_transcript() == "text"
+            mock_transcribe.assert_called_once_with("a.m4a")
+
+
 @pytest.mark.unit
 class TestFileSplitting:
     """Test audio file splitting."""
@@ -114,22 +322,40 @@ class TestFileSplitting:
 
         def run_side_effect(*args, **kwargs):
             if 'ffprobe' in args[0]:
-                # Create dummy chunk files when ffmpeg is called
-                chunk_path = args[0][-1] if len(args[0]) > 0 else None
-                if chunk_path and 'chunk' in str(chunk_path):
-                    Path(chunk_path).touch()
                 return ffprobe_result
-            else:
-                return ffmpeg_result
+            # Create the chunk files the segment muxer would write
+            pattern = args[0][-1]
+            for i in range(3):
+                Path(pattern % i).touch()
+            return ffmpeg_result
 
         mock_run.side_effect = run_side_effect
 
-        # Note: This test is simplified - a real implementation would need
-        # more sophisticated mocking
         result = split_audio_file(str(large_audio_file), max_size_mb=24)
 
-        # Verify ffprobe was called
-        assert mock_run.call_count >= 1
+        # One ffprobe call for the duration and one ffmpeg call for all chunks
+        assert mock_run.call_count == 2
+        ffmpeg_args = mock_run.call_args_list[1][0][0]
+        assert ffmpeg_args[0] == 'ffmpeg'
+        assert 'segment' in ffmpeg_args
+        assert result == [
+            str(chunk_dir / f"chunk_{i:03d}.m4a") for i in range(3)
+        ]
+
+    @patch('subprocess.run')
+    @patch('tempfile.mkdtemp')
+    def test_split_m4a_reads_duration_without_ffprobe(self, mock_mkdtemp, mock_run, large_audio_file, temp_dir):
+        """Test that the duration of a well-formed M4A comes from its atoms."""
+        chunk_dir = temp_dir / "chunks"
+        chunk_dir.mkdir()
+        mock_mkdtemp.return_value = str(chunk_dir)
+
+        with patch('transcribe_memos.mp4_duration', return_value=120.5):
+            split_audio_file(str(large_audio_file), max_size_mb=24)
+
+        # Only the ffmpeg split is run
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][0] == 'ffmpeg'
 
     def test_split_audio_file_returns_list(self, sample_audio_file):
         """Test that split_audio_file always returns a list."""
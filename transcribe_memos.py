@@ -12,12 +12,14 @@ Supports:
 import os
 import json
 import hashlib
+import functools
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 # Destination abstraction
 from destinations import create_destination
+from destinations.utils import loads_json, monday_of, mp4_duration
 
 # =============================================================================
 # CONFIGURATION - Edit these settings
@@ -31,10 +33,33 @@ CONFIG = {
     # Larger = more accurate but slower
     "whisper_model": "small",
 
+    # Local Whisper implementation: "openai" (openai-whisper), "faster"
+    # (faster-whisper, quantized and several times faster on CPU), or "auto"
+    # (faster-whisper if installed, otherwise openai-whisper)
+    "local_impl": "openai",
+
+    # faster-whisper weight precision: "int8", "int8_float16", "float16", "float32"
+    "whisper_compute_type": "int8",
+
     # OpenAI API key (only needed if backend is "openai")
     # Set via environment variable OPENAI_API_KEY or paste here
     "openai_api_key": os.environ.get("OPENAI_API_KEY", ""),
 
+    # Chunks of a long recording sent to the OpenAI API at once
+    # Lower this if you run into rate limits
+    "max_parallel_chunks": 4,
+
+    # Memos transcribed ahead by the OpenAI backend while earlier ones are
+    # written to the destination. While several memos run at once, each
+    # sends its chunks one at a time, so this also caps uploads in flight
+    "max_parallel_memos": 4,
+
+    # Buffered destination writes (Google Docs) are sent once this many
+    # memos are queued and at the end of the run, so memos bound for
+    # different documents are written together. Memos still queued when a
+    # run is interrupted are not marked processed and are redone next run
+    "flush_every": 20,
+
     # Voice Memos location (default macOS location)
     "voice_memos_path": os.path.expanduser(
         "~/Library/Group Containers/group.com.apple.VoiceMemos.shared/Recordings/"
@@ -128,22 +153,68 @@ def migrate_legacy_config(config: dict) -> dict:
 # TRANSCRIPTION BACKENDS
 # =============================================================================
 
-def transcribe_local(audio_path: str) -> str:
-    """Transcribe using local Whisper model."""
+# Whisper models loaded by transcribe_local, by (local_impl, model name,
+# compute type), so a batch of memos loads the model once. Each is kept as
+# a function that transcribes a file, whichever Whisper package it comes from.
+_whisper_models = {}
+
+
+def _load_whisper_model(impl: str, model_name: str, compute_type: str):
+    """Load a local Whisper model, returning a function that transcribes a file.
+
+    impl is CONFIG["local_impl"]: "openai" uses openai-whisper, "faster"
+    uses faster-whisper (CTranslate2, quantized to compute_type), and
+    "auto" uses faster-whisper if it is installed, otherwise openai-whisper.
+    """
+    if impl not in ("auto", "faster", "openai"):
+        raise ValueError(f"Unknown local_impl: {impl}")
+
+    if impl != "openai":
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            if impl == "faster":
+                raise
+        else:
+            model = WhisperModel(model_name, device="auto", compute_type=compute_type)
+
+            def transcribe_file(audio_path):
+                segments, _ = model.transcribe(audio_path)
+                return "".join(segment.text for segment in segments).strip()
+
+            return transcribe_file
+
     import whisper
-    
-    model_name = CONFIG["whisper_model"]
-    print(f"  Loading Whisper model '{model_name}'...")
+
     model = whisper.load_model(model_name)
-    
-    print(f"  Transcribing...")
-    result = model.transcribe(audio_path)
-    return result["text"].strip()
+    return lambda audio_path: model.transcribe(audio_path)["text"].strip()
+
+
+def transcribe_local(audio_path: str, log=print) -> str:
+    """Transcribe using local Whisper model.
+
+    Progress messages are passed to log.
+    """
+    model_name = CONFIG["whisper_model"]
+    key = (
+        CONFIG.get("local_impl", "openai"),
+        model_name,
+        CONFIG.get("whisper_compute_type", "int8"),
+    )
+    transcribe_file = _whisper_models.get(key)
+    if transcribe_file is None:
+        log(f"  Loading Whisper model '{model_name}'...")
+        transcribe_file = _whisper_models[key] = _load_whisper_model(*key)
+
+    log(f"  Transcribing...")
+    return transcribe_file(audio_path)
 
 
-def split_audio_file(audio_path: str, max_size_mb: int = 24) -> list[str]:
+def split_audio_file(audio_path: str, max_size_mb: int = 24, log=print) -> list[str]:
     """Split audio file into chunks smaller than max_size_mb.
 
+    Progress messages are passed to log.
+
     Returns list of chunk file paths.
     """
     import subprocess
@@ -155,16 +226,19 @@ def split_audio_file(audio_path: str, max_size_mb: int = 24) -> list[str]:
         # File is small enough, no splitting needed
         return [audio_path]
 
-    print(f"  File size: {file_size_mb:.1f}MB - splitting into chunks...")
+    log(f"  File size: {file_size_mb:.1f}MB - splitting into chunks...")
 
-    # Get audio duration using ffprobe
-    result = subprocess.run(
-        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-         '-of', 'default=noprint_wrappers=1:nokey=1', audio_path],
-        capture_output=True,
-        text=True
-    )
-    duration_seconds = float(result.stdout.strip())
+    # Get audio duration from the M4A atoms, as validate_audio_file does,
+    # falling back to ffprobe for anything else
+    duration_seconds = mp4_duration(audio_path)
+    if not duration_seconds:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', audio_path],
+            capture_output=True,
+            text=True
+        )
+        duration_seconds = float(result.stdout.strip())
 
     # Calculate chunk duration to keep each chunk under max_size_mb
     # Estimate: size is roughly proportional to duration
@@ -172,36 +246,41 @@ def split_audio_file(audio_path: str, max_size_mb: int = 24) -> list[str]:
 
     # Create temporary directory for chunks
     temp_dir = tempfile.mkdtemp(prefix="voice-memo-chunks-")
-    chunks = []
-
-    # Split the file into chunks
-    chunk_num = 0
-    start_time = 0
 
-    while start_time < duration_seconds:
-        chunk_path = os.path.join(temp_dir, f"chunk_{chunk_num:03d}.m4a")
-
-        # Use ffmpeg to extract chunk
-        subprocess.run(
-            ['ffmpeg', '-i', audio_path, '-ss', str(start_time),
-             '-t', str(chunk_duration), '-c', 'copy', '-y', chunk_path],
-            capture_output=True,
-            check=True
-        )
+    # Split the file into chunks in one pass with ffmpeg's segment muxer,
+    # rather than one ffmpeg run per chunk each seeking from the start
+    subprocess.run(
+        ['ffmpeg', '-i', audio_path, '-f', 'segment',
+         '-segment_time', str(chunk_duration), '-c', 'copy',
+         '-reset_timestamps', '1', '-y',
+         os.path.join(temp_dir, 'chunk_%03d.m4a')],
+        capture_output=True,
+        check=True
+    )
 
-        chunks.append(chunk_path)
-        start_time += chunk_duration
-        chunk_num += 1
+    chunks = [
+        os.path.join(temp_dir, name)
+        for name in sorted(os.listdir(temp_dir))
+        if name.startswith("chunk_") and name.endswith(".m4a")
+    ]
 
-    print(f"  Created {len(chunks)} chunks")
+    log(f"  Created {len(chunks)} chunks")
     return chunks
 
 
 def validate_audio_file(audio_path: str) -> tuple[bool, str]:
     """Validate that audio file can be decoded.
 
+    Well-formed M4A files (the Voice Memos format) are checked by reading
+    their atoms directly; anything else is probed with ffprobe, which also
+    explains what is wrong with a file.
+
     Returns: (is_valid, error_message)
     """
+    duration = mp4_duration(audio_path)
+    if duration is not None and duration > 0:
+        return True, ""
+
     import subprocess
 
     result = subprocess.run(
@@ -225,13 +304,15 @@ def validate_audio_file(audio_path: str) -> tuple[bool, str]:
     return True, ""
 
 
-def transcribe_openai(audio_path: str) -> str:
-    """Transcribe using OpenAI API.
+# (api_key, client) for the OpenAI client shared by every transcribe_openai
+# call, so its connection pool stays warm across chunks and memos
+_openai_client = None
 
-    Automatically splits files larger than 25MB into chunks.
-    """
+
+def _get_openai_client():
+    """Return the OpenAI client for the configured API key, creating it once."""
+    global _openai_client
     from openai import OpenAI
-    import shutil
 
     api_key = CONFIG["openai_api_key"]
     if not api_key:
@@ -240,7 +321,21 @@ def transcribe_openai(audio_path: str) -> str:
             "or add it to CONFIG in this script."
         )
 
-    client = OpenAI(api_key=api_key)
+    if _openai_client is None or _openai_client[0] != api_key:
+        _openai_client = (api_key, OpenAI(api_key=api_key))
+    return _openai_client[1]
+
+
+def transcribe_openai(audio_path: str, log=print, max_parallel_chunks: Optional[int] = None) -> str:
+    """Transcribe using OpenAI API.
+
+    Automatically splits files larger than 25MB into chunks, uploading up to
+    max_parallel_chunks (default CONFIG["max_parallel_chunks"]) at once.
+    Progress messages are passed to log.
+    """
+    import shutil
+
+    client = _get_openai_client()
 
     # Validate audio file first
     is_valid, error_msg = validate_audio_file(audio_path)
@@ -248,28 +343,39 @@ def transcribe_openai(audio_path: str) -> str:
         raise ValueError(f"Corrupted audio file: {error_msg}")
 
     # Split file if needed
-    chunks = split_audio_file(audio_path, max_size_mb=24)
+    chunks = split_audio_file(audio_path, max_size_mb=24, log=log)
     temp_dir = None
 
     try:
         if len(chunks) > 1:
             temp_dir = os.path.dirname(chunks[0])
-            print(f"  Transcribing {len(chunks)} chunks...")
+            log(f"  Transcribing {len(chunks)} chunks...")
         else:
-            print(f"  Sending to OpenAI API...")
+            log(f"  Sending to OpenAI API...")
 
-        transcripts = []
-
-        for i, chunk_path in enumerate(chunks):
+        def transcribe_chunk(i, chunk_path):
             if len(chunks) > 1:
-                print(f"    Chunk {i+1}/{len(chunks)}...")
+                log(f"    Chunk {i+1}/{len(chunks)}...")
 
             with open(chunk_path, "rb") as audio_file:
                 transcript = client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file
                 )
-            transcripts.append(transcript.text.strip())
+            return transcript.text.strip()
+
+        # Each chunk is a separate upload, so long recordings are sent
+        # several at a time; map() keeps the transcripts in chunk order
+        if max_parallel_chunks is None:
+            max_parallel_chunks = CONFIG.get("max_parallel_chunks", 4)
+        workers = min(len(chunks), max_parallel_chunks)
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                transcripts = list(pool.map(transcribe_chunk, range(len(chunks)), chunks))
+        else:
+            transcripts = [transcribe_chunk(i, path) for i, path in enumerate(chunks)]
 
         # Combine all transcripts
         full_transcript = " ".join(transcripts)
@@ -279,20 +385,90 @@ def transcribe_openai(audio_path: str) -> str:
         # Clean up temporary chunks
         if temp_dir and os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
-            print(f"  Cleaned up temporary chunks")
+            log(f"  Cleaned up temporary chunks")
 
 
-def transcribe(audio_path: str) -> str:
-    """Transcribe audio file using configured backend."""
+def transcribe(audio_path: str, log=print, max_parallel_chunks: Optional[int] = None) -> str:
+    """Transcribe audio file using configured backend.
+
+    Progress messages are passed to log; max_parallel_chunks only applies
+    to the OpenAI backend (see transcribe_openai).
+    """
     backend = CONFIG["backend"]
     
     if backend == "local":
-        return transcribe_local(audio_path)
+        return transcribe_local(audio_path, log)
     elif backend == "openai":
-        return transcribe_openai(audio_path)
+        return transcribe_openai(audio_path, log, max_parallel_chunks)
     else:
         raise ValueError(f"Unknown backend: {backend}")
 
+
+# Memos smaller than this are skipped by main() as empty or corrupted
+MIN_MEMO_BYTES = 1000
+
+
+def transcribe_ahead(audio_paths: list):
+    """Yield a callable returning each file's transcript, in order.
+
+    With the OpenAI backend, where each memo mostly waits on uploads, up
+    to CONFIG["max_parallel_memos"] files are transcribed ahead in
+    background threads; calling a file's callable waits for its result
+    (or re-raises its error) and then prints the progress messages its
+    transcription logged. Files under MIN_MEMO_BYTES, which main() skips,
+    are not sent ahead. Memos running side by side upload their chunks one
+    at a time, so at most max_parallel_memos uploads are in flight.
+
+    Local Whisper transcribes one file at a time, when its callable is
+    called.
+    """
+    workers = 1
+    if CONFIG["backend"] == "openai":
+        workers = min(len(audio_paths), CONFIG.get("max_parallel_memos", 4))
+
+    if workers <= 1:
+        for audio_path in audio_paths:
+            yield functools.partial(transcribe, audio_path)
+        return
+
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    def start(audio_path):
+        try:
+            if os.path.getsize(audio_path) < MIN_MEMO_BYTES:
+                return None
+        except OSError:
+            return None
+        lines = []
+        return lines, pool.submit(transcribe, audio_path, lines.append, max_parallel_chunks=1)
+
+    def result(audio_path, started):
+        if started is None:
+            return transcribe(audio_path)
+        lines, future = started
+        try:
+            return future.result()
+        finally:
+            for line in lines:
+                print(line)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    started = deque()
+    try:
+        for audio_path in audio_paths[:workers]:
+            started.append(start(audio_path))
+        for i, audio_path in enumerate(audio_paths):
+            if i + workers < len(audio_paths):
+                started.append(start(audio_paths[i + workers]))
+            yield functools.partial(result, audio_path, started.popleft())
+    finally:
+        # Stopped early: don't start transcriptions nobody will read
+        for entry in started:
+            if entry is not None:
+                entry[1].cancel()
+        pool.shutdown(wait=False)
+
 # =============================================================================
 # NOTE: Google Docs integration moved to destinations/google_docs.py
 # =============================================================================
@@ -307,44 +483,186 @@ def get_monday_of_week(date: datetime) -> str:
 
     Kept for backward compatibility with tests.
     """
-    from datetime import timedelta
-
-    weekday = date.weekday()
-    days_to_monday = weekday
-    monday = date - timedelta(days=days_to_monday)
-    return monday.strftime("%Y-%m-%d")
+    return monday_of(date).isoformat()
 
 
 # =============================================================================
 # MEMO TRACKING
 # =============================================================================
 
+# processed.json as last read or written here: (path, (mtime_ns, size), hashes).
+# While the file is unchanged on disk it isn't re-parsed, and new hashes are
+# spliced in before its closing "]" instead of re-serializing the whole list.
+_processed_state = None
+
+
+def _file_stat(path: Path) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse_processed(content: bytes) -> list:
+    """Parse processed.json, recovering from an interrupted in-place append.
+
+    An append that didn't fully land leaves the list without its closing
+    "]", possibly ending partway through a hash; every complete entry
+    before that point is kept.
+    """
+    try:
+        return loads_json(content)
+    except ValueError as e:
+        error = e
+
+    end = len(content)
+    # The last quote either closes the last complete entry or opens a torn
+    # one, in which case the quote before it closes the last complete entry
+    for _ in range(2):
+        end = content.rfind(b'"', 0, end)
+        if end < 0:
+            break
+        try:
+            return loads_json(content[:end + 1] + b"]")
+        except ValueError:
+            pass
+    raise error
+
+
 def get_processed_memos() -> set:
-    """Get set of already-processed memo file hashes."""
+    """Get set of already-processed memo file hashes.
+
+    The file is only parsed again if it changed since it was last read or
+    written here.
+    """
+    global _processed_state
     data_dir = Path(CONFIG["data_dir"])
     processed_path = data_dir / "processed.json"
-    
-    if processed_path.exists():
-        with open(processed_path) as f:
-            return set(json.load(f))
-    return set()
+
+    try:
+        file_stat = _file_stat(processed_path)
+    except FileNotFoundError:
+        return set()
+
+    if _processed_state is not None and _processed_state[:2] == (processed_path, file_stat):
+        return set(_processed_state[2])
+
+    with open(processed_path, "rb") as f:
+        content = f.read()
+    processed = set(_parse_processed(content))
+    # Only files ending in a bare "]" (as json.dump writes them) can be
+    # appended to in place; anything else, including a file recovered
+    # above, is rewritten in full on the next save
+    if processed and content.endswith(b"]"):
+        _processed_state = (processed_path, file_stat, set(processed))
+    return processed
 
 
 def save_processed_memos(processed: set):
-    """Save the set of processed memo hashes."""
+    """Save the set of processed memo hashes.
+
+    New hashes are normally appended in place. If that write is cut short,
+    get_processed_memos still recovers every entry saved before it (see
+    _parse_processed). Full rewrites go through a temp file and os.replace,
+    so they leave either the old list or the new one.
+    """
+    global _processed_state
     data_dir = Path(CONFIG["data_dir"])
     processed_path = data_dir / "processed.json"
-    
-    with open(processed_path, "w") as f:
-        json.dump(list(processed), f)
+
+    added = None
+    if _processed_state is not None:
+        saved_path, saved_stat, saved = _processed_state
+        try:
+            unchanged = saved_path == processed_path and _file_stat(processed_path) == saved_stat
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged and saved <= processed:
+            added = processed - saved
+
+    if added is not None:
+        if not added:
+            return
+        # Overwrite the closing "]" with the new entries
+        with open(processed_path, "r+b") as f:
+            f.seek(saved_stat[1] - 1)
+            f.write(("".join(", " + json.dumps(h) for h in added) + "]").encode())
+    else:
+        # Write a new file and swap it in, so a crash mid-write leaves the
+        # previous list rather than a truncated one
+        tmp_path = processed_path.with_name(processed_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(list(processed), f)
+        os.replace(tmp_path, processed_path)
+
+    _processed_state = (
+        (processed_path, _file_stat(processed_path), set(processed)) if processed else None
+    )
 
 
 def get_file_hash(filepath: str) -> str:
     """Get a hash of file path + modification time for tracking."""
-    stat = os.stat(filepath)
-    content = f"{filepath}:{stat.st_mtime}"
+    return _file_hash(filepath, os.stat(filepath).st_mtime)
+
+
+def _file_hash(filepath: str, mtime: float) -> str:
+    """get_file_hash for a file whose mtime is already known."""
+    content = f"{filepath}:{mtime}"
     return hashlib.md5(content.encode()).hexdigest()
 
+
+def _iter_audio_files(folder: str):
+    """Yield os.DirEntry objects for the .m4a files under folder, recursively.
+
+    Uses os.scandir so file types come from the directory listing and each
+    entry's stat() is cached, instead of extra stat calls per file. Like
+    Path.glob("**"), symlinked directories are not descended into, so a link
+    back to a parent can't loop and a linked folder isn't found twice.
+    """
+    pending = [folder]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".m4a") and entry.is_file():
+                    yield entry
+
+
+def commit_pending_memos(destination, pending: list, processed: set) -> list[str]:
+    """Flush buffered destination writes and mark those memos as processed.
+
+    Args:
+        destination: Destination the memos were appended to
+        pending: (filepath, filename, file_hash) tuples appended since the
+            last flush. Cleared on return.
+        processed: Set of processed memo hashes to update and save
+
+    Returns:
+        Filenames of memos whose write failed (NOT marked as processed)
+    """
+    if not pending:
+        return []
+
+    try:
+        # filepath -> error for the memos the destination couldn't write
+        unwritten = destination.flush() or {}
+    except Exception as e:
+        unwritten = {filepath: e for filepath, _, _ in pending}
+
+    failed = []
+    for filepath, filename, file_hash in pending:
+        if filepath in unwritten:
+            failed.append(filename)
+        else:
+            processed.add(file_hash)
+    if len(failed) < len(pending):
+        save_processed_memos(processed)
+    pending.clear()
+
+    if failed:
+        print(f"   ❌ Error writing to destination: {next(iter(unwritten.values()))}")
+        print(f"   ⚠️  {len(failed)} memo(s) NOT marked as processed - will retry on next run")
+    return failed
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -364,18 +682,20 @@ def find_new_memos() -> list[tuple[str, str, datetime]]:
     processed = get_processed_memos()
     new_memos = []
     
-    # Find all audio files
-    for audio_file in memos_path.glob("**/*.m4a"):
-        file_hash = get_file_hash(str(audio_file))
+    # Find all audio files (one stat each, shared by the hash and the timestamp)
+    for entry in _iter_audio_files(str(memos_path)):
+        st_mtime = entry.stat().st_mtime
+        file_hash = _file_hash(entry.path, st_mtime)
         
         if file_hash not in processed:
-            # Get modification time as datetime
-            mtime = datetime.fromtimestamp(audio_file.stat().st_mtime)
-            new_memos.append((str(audio_file), audio_file.stem, mtime))
+            new_memos.append((st_mtime, entry.path, entry.name))
     
-    # Sort by timestamp
-    new_memos.sort(key=lambda x: x[2])
-    return new_memos
+    # Sort by timestamp (as floats), then get modification times as datetimes
+    new_memos.sort()
+    return [
+        (path, os.path.splitext(name)[0], datetime.fromtimestamp(st_mtime))
+        for st_mtime, path, name in new_memos
+    ]
 
 
 def main():
@@ -431,44 +751,62 @@ def main():
         traceback.print_exc()
         return
 
+    # Extract audio metadata for every memo up front, in one batch
+    destination.prefetch_metadata([filepath for filepath, _, _ in new_memos])
+
     # Process each memo
     processed = get_processed_memos()
     success_count = 0
     failed_count = 0
     failed_memos = []
-    session_cache = {}  # Cache session IDs by date to avoid repeated prep
+    pending = []  # (filepath, filename, file_hash) appended but not yet flushed
+    flush_every = CONFIG.get("flush_every", 20)
 
-    for filepath, filename, memo_datetime in new_memos:
-        timestamp_str = memo_datetime.strftime("%Y-%m-%d %H:%M:%S")
+    transcripts = transcribe_ahead([filepath for filepath, _, _ in new_memos])
+
+    for (filepath, filename, memo_datetime), get_transcript in zip(new_memos, transcripts):
+        timestamp_str = memo_datetime.isoformat(sep=" ", timespec="seconds")
         print(f"\n🎙️  Processing: {filename}")
         print(f"   Recorded: {timestamp_str}")
 
         transcript = None
         try:
+            # One stat per memo, for both the size check and its processed hash
+            st = os.stat(filepath)
+            file_hash = _file_hash(filepath, st.st_mtime)
+
             # Check file size - skip empty or very small files
-            file_size = os.path.getsize(filepath)
-            if file_size < 1000:  # Less than 1KB
+            file_size = st.st_size
+            if file_size < MIN_MEMO_BYTES:
                 print(
                     f"   ⚠️  Skipping: File is too small ({file_size} bytes) - likely empty or corrupted"
                 )
                 # Mark as processed so we don't keep trying
-                file_hash = get_file_hash(filepath)
                 processed.add(file_hash)
                 save_processed_memos(processed)
                 continue
 
             # Prepare destination for this memo
-            # Use destination-specific cache key (handles daily vs weekly organization)
-            cache_key = destination.get_cache_key(memo_datetime, filepath)
-            if cache_key not in session_cache:
-                session_id = destination.prepare_for_memo(memo_datetime, filepath)
-                session_cache[cache_key] = session_id
-            else:
-                session_id = session_cache[cache_key]
+            # Sessions are reused per destination-specific cache key
+            # (handles daily vs weekly organization)
+            session_id = destination.get_session_id(memo_datetime, filepath)
+
+            # Write out buffered memos once enough are queued; until then
+            # memos for any doc/tab keep queueing, so one flush can write
+            # several documents at once
+            if len(pending) >= flush_every:
+                queued_count = len(pending)
+                print(f"\n💾 Writing {queued_count} queued memo(s)...")
+                flush_failed = commit_pending_memos(destination, pending, processed)
+                if len(flush_failed) < queued_count:
+                    print(f"   ✅ Done! {queued_count - len(flush_failed)} memo(s) written")
+                success_count += queued_count - len(flush_failed)
+                failed_count += len(flush_failed)
+                failed_memos.extend(flush_failed)
 
             # Transcribe
             print(f"   Transcribing with {CONFIG['backend']} backend...")
-            transcript = transcribe(filepath)
+            transcript = get_transcript()
             print(f"   ✓ Transcription complete")
 
             # Append to destination
@@ -479,12 +817,20 @@ def main():
             print(f"   ✓ Added to destination")
 
             # Mark as processed ONLY if both transcription and destination append succeeded
-            file_hash = get_file_hash(filepath)
-            processed.add(file_hash)
-            save_processed_memos(processed)
+            # (buffered appends are marked, and counted, once the destination
+            # has flushed them)
+            pending.append((filepath, filename, file_hash))
+            if destination.has_pending_writes():
+                print(f"   ⏳ Queued - will be written with the next batch")
+                continue
 
-            print(f"   ✅ Done!")
-            success_count += 1
+            queued_count = len(pending)
+            flush_failed = commit_pending_memos(destination, pending, processed)
+            success_count += queued_count - len(flush_failed)
+            failed_count += len(flush_failed)
+            failed_memos.extend(flush_failed)
+            if not flush_failed:
+                print(f"   ✅ Done!")
 
         except ValueError as e:
             # Corrupted file - skip and mark as processed
@@ -492,7 +838,6 @@ def main():
             if "Corrupted audio file" in error_msg:
                 print(f"   ⚠️  Skipping: {error_msg}")
                 print(f"   Marking as processed to avoid retrying corrupted file")
-                file_hash = get_file_hash(filepath)
                 processed.add(file_hash)
                 save_processed_memos(processed)
                 failed_count += 1
@@ -518,6 +863,16 @@ def main():
             traceback.print_exc()
             continue
 
+    if pending:
+        queued_count = len(pending)
+        print(f"\n💾 Writing {queued_count} queued memo(s)...")
+        flush_failed = commit_pending_memos(destination, pending, processed)
+        if len(flush_failed) < queued_count:
+            print(f"   ✅ Done! {queued_count - len(flush_failed)} memo(s) written")
+        success_count += queued_count - len(flush_failed)
+        failed_count += len(flush_failed)
+        failed_memos.extend(flush_failed)
+
     # Cleanup and summary
     destination.cleanup()
 